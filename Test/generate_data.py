@@ -1,17 +1,54 @@
 import requests
+import numpy as np
 import random
-import json
+import orjson
 import time
 from datetime import datetime, timedelta
 from math import cos, pi
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 API_BASE_URL = "http://localhost:8000/api"
 
+# Shared HTTP session so every call reuses pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.2)
+))
+SESSION.headers.update({"Content-Type": "application/json"})
+
+# Bulk RSVP URL template is constant, so build it once
+_BULK_RSVP_URL = API_BASE_URL + "/events/{event_id}/rsvp/bulk"
+
+def post_json(url, payload):
+    """POST a JSON payload on the shared session, serialized with orjson"""
+    return SESSION.post(url, data=orjson.dumps(payload))
+
+# Shared worker pool for independent API calls (sized below the session pool)
+MAX_WORKERS = 16
+EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+# Maximum number of operations sent in one bulk request
+BULK_CHUNK_SIZE = 100
+
 # Reference location: Goa, India
 BASE_LATITUDE = 15.421042
 BASE_LONGITUDE = 73.980793
 MAX_DISTANCE_KM = 15
 
+# Offset ranges in degrees for MAX_DISTANCE_KM around the base location
+# Approximate conversion: 1 degree latitude = 111 km
+# Longitude conversion varies with latitude due to the Earth's curvature
+_LAT_OFFSET_RANGE = MAX_DISTANCE_KM / 111.0
+_LON_OFFSET_RANGE = MAX_DISTANCE_KM / (111.0 * cos(BASE_LATITUDE * pi / 180))
+
+# Shared NumPy generator for drawing batches of sample data in one call
+_RNG = np.random.default_rng()
+
 # Provided interests
 interests = [
     "tech", "music", "art", "food", "sports", "gaming", 
@@ -51,7 +88,49 @@ event_descriptions = [
     "Watch elite athletes compete for the championship title."
 ]
 
+session_types = ["Workshop", "Talk", "Panel", "Networking"]
+
+feedback_comments = [
+    "Really enjoyed this event!",
+    "Great organization and content.",
+    "Would definitely attend again.",
+    "Excellent speakers and venue.",
+    "Learned a lot from this event."
+]
+
+# Constant per-event fields, built once; create_events fills in the rest
+_EVENT_SKELETONS = [
+    {
+        "title": event_titles[i],
+        "description": event_descriptions[i],
+        "category": event_categories[i],
+        "image_url": f"https://picsum.photos/800/600?random={i}",
+        "organizer_email": "organizer@example.com"
+    }
+    for i in range(len(event_titles))
+]
+
+# NumPy copies of the sample lists so batches can be drawn by integer index
+_FIRST = np.array(first_names)
+_LAST = np.array(last_names)
+_INTERESTS = np.array(interests)
+_SESSION_TYPES = np.array(session_types)
+_FEEDBACK_COMMENTS = np.array(feedback_comments)
+
 # Helper functions
+def draw(values, size):
+    """Draw size random entries from a NumPy array as a Python list"""
+    return values[_RNG.integers(0, len(values), size=size)].tolist()
+
+def random_full_names(count):
+    """Generate count random "First Last" names"""
+    return [f"{first} {last}" for first, last in zip(draw(_FIRST, count), draw(_LAST, count))]
+
+def chunked(items, size=BULK_CHUNK_SIZE):
+    """Yield consecutive slices of at most size items"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
 def generate_random_interests(min_count=2, max_count=5):
     """Generate a random set of interests"""
     count = random.randint(min_count, max_count)
@@ -68,19 +147,41 @@ def format_error(response):
     except:
         return f"Error: {response.status_code} - {response.text}"
 
-def print_response(response, action_msg):
-    """Print API response with action message"""
+def print_response(response, action_msg, parse=True):
+    """Print API response with action message
+    
+    With parse=False the body is left unparsed and True is returned on success,
+    for callers that don't use the response data.
+    """
     if response.status_code >= 200 and response.status_code < 300:
         print(f"✅ {action_msg} - Status: {response.status_code}")
-        return response.json()
+        return orjson.loads(response.content) if parse else True
     else:
         print(f"❌ {action_msg} - Status: {response.status_code}")
         print(format_error(response))
         return None
 
-def check_mutual_interests(user1_interests, user2_interests):
-    """Check if two users have at least one mutual interest"""
-    return bool(set(user1_interests) & set(user2_interests))
+def print_bulk_response(response, action_msgs):
+    """Print per-item results of a bulk API call
+    
+    Returns the item results in input order (None for failed items), or None
+    if the bulk request itself failed.
+    """
+    if response.status_code < 200 or response.status_code >= 300:
+        print(f"❌ Bulk request - Status: {response.status_code}")
+        print(format_error(response))
+        return None
+    
+    results = []
+    for item, action_msg in zip(orjson.loads(response.content)["results"], action_msgs):
+        if 200 <= item["status_code"] < 300:
+            print(f"✅ {action_msg} - Status: {item['status_code']}")
+            results.append(item.get("result"))
+        else:
+            print(f"❌ {action_msg} - Status: {item['status_code']}")
+            print(f"Error: {item['status_code']} - {item.get('detail')}")
+            results.append(None)
+    return results
 
 def validate_event_times(start_time, end_time, min_duration_hours=8):
     """Validate that event times are correct with minimum duration"""
@@ -110,24 +211,110 @@ def validate_schedule_item_times(item_start, item_end, event_start, event_end):
 
 def generate_location_near_base(max_distance_km=MAX_DISTANCE_KM):
     """Generate a random location within specified distance of base coordinates"""
-    # Convert max distance from km to degrees
-    # Approximate conversion: 1 degree latitude = 111 km
-    # Longitude conversion varies with latitude due to the Earth's curvature
-    lat_offset_range = max_distance_km / 111.0
+    # The base is constant, so only rescale the precomputed ranges
+    lat_offset_range = _LAT_OFFSET_RANGE
+    lon_offset_range = _LON_OFFSET_RANGE
+    if max_distance_km != MAX_DISTANCE_KM:
+        scale = max_distance_km / MAX_DISTANCE_KM
+        lat_offset_range *= scale
+        lon_offset_range *= scale
     
-    # Adjust longitude range based on latitude (Earth narrows at higher latitudes)
-    # cos(latitude in radians) gives the adjustment factor
-    lon_offset_range = max_distance_km / (111.0 * cos(BASE_LATITUDE * pi / 180))
+    return (BASE_LATITUDE + random.uniform(-lat_offset_range, lat_offset_range),
+            BASE_LONGITUDE + random.uniform(-lon_offset_range, lon_offset_range))
+
+def bulk_create_users(users_list):
+    """Create users in bulk chunks, returning one result per user in input order"""
+    results = []
+    for chunk in chunked(users_list):
+        response = post_json(f"{API_BASE_URL}/users/bulk", {"users": chunk})
+        chunk_results = print_bulk_response(response, [f"Created user {user['display_name']}" for user in chunk])
+        results.extend(chunk_results if chunk_results is not None else [None] * len(chunk))
+    return results
+
+def wait_for_event(event_id, timeout=20, initial=0.1):
+    """Poll an event with exponential backoff until it exists or the timeout expires
     
-    # Generate random offsets within range
-    lat_offset = random.uniform(-lat_offset_range, lat_offset_range)
-    lon_offset = random.uniform(-lon_offset_range, lon_offset_range)
+    Returns the last response so the caller can report success or failure.
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial
+    while True:
+        response = SESSION.get(f"{API_BASE_URL}/events/{event_id}")
+        if 200 <= response.status_code < 300:
+            return response
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return response
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 2.0)
+
+def bulk_add_rsvps(event, attending_users):
+    """Add attending RSVPs for all users in one request"""
+    for user in attending_users:
+        print(f"Adding RSVP for {user['display_name']} to {event['title']}")
+    rsvp_payload = {"rsvps": [{"user_id": user['uid'], "status": "attending"} for user in attending_users]}
+    response = post_json(_BULK_RSVP_URL.format(event_id=event['id']), rsvp_payload)
+    print_bulk_response(response, [f"Added RSVP for {user['display_name']}" for user in attending_users])
+
+def respond_to_connections(accepted):
+    """Accept (sender, receiver) requests in bulk chunks"""
+    for chunk in chunked(accepted):
+        for user, other_user in chunk:
+            print(f"{other_user['display_name']} is accepting connection from {user['display_name']}")
+        
+        payload = {"responses": [
+            {"request_id": user['uid'], "user_id": other_user['uid'], "status": "accept"}
+            for user, other_user in chunk
+        ]}
+        response = post_json(f"{API_BASE_URL}/connections/respond/bulk", payload)
+        print_bulk_response(
+            response,
+            [f"{other_user['display_name']} accepted connection from {user['display_name']}" for user, other_user in chunk]
+        )
+
+def bulk_connection_requests(pairs):
+    """Send (sender, receiver) connection requests in bulk chunks, returning one result per pair in input order"""
+    results = []
+    for chunk in chunked(pairs):
+        for user, other_user in chunk:
+            mutual = user['interest_set'] & other_user['interest_set']
+            print(f"Creating connection request: {user['display_name']} -> {other_user['display_name']}")
+            print(f"  Mutual interests: {', '.join(mutual)}")
+        
+        payload = {"requests": [
+            {"from_user_id": user['uid'], "to_user_id": other_user['uid']}
+            for user, other_user in chunk
+        ]}
+        response = post_json(f"{API_BASE_URL}/connections/request/bulk", payload)
+        chunk_results = print_bulk_response(
+            response,
+            [f"Created connection request from {user['display_name']} to {other_user['display_name']}" for user, other_user in chunk]
+        )
+        results.extend(chunk_results if chunk_results is not None else [None] * len(chunk))
+    return results
+
+def submit_feedback(event, user, feedback_data):
+    """Submit one user's feedback for an event, returning True on success"""
+    print(f"Creating feedback from {user['display_name']} for {event['title']}")
     
-    # Add offsets to base coordinates
-    lat = BASE_LATITUDE + lat_offset
-    lng = BASE_LONGITUDE + lon_offset
+    response = post_json(
+        f"{API_BASE_URL}/feedback/{event['id']}?user_id={user['uid']}", 
+        feedback_data
+    )
     
-    return lat, lng
+    return bool(print_response(response, f"Created feedback from {user['display_name']} for {event['title']}", parse=False))
+
+def bulk_update_locations(users, lats, lngs):
+    """Update locations for all users in bulk chunks"""
+    for chunk in chunked(list(zip(users, lats, lngs))):
+        for user, lat, lng in chunk:
+            print(f"Updating location for {user['display_name']}: {lat:.6f}, {lng:.6f}")
+        payload = {"users": [
+            {"uid": user['uid'], "latitude": lat, "longitude": lng}
+            for user, lat, lng in chunk
+        ]}
+        response = post_json(f"{API_BASE_URL}/users/locations", payload)
+        print_bulk_response(response, [f"Updated location for {user['display_name']}" for user, _, _ in chunk])
 
 # Main functions
 def create_users(count=50):
@@ -135,64 +322,55 @@ def create_users(count=50):
     print(f"\n{'=' * 50}\nGENERATING {count} USERS\n{'=' * 50}")
     
     users = []
+    # Draw every user's names and bio interests in one batch each
+    user_first_names = draw(_FIRST, count)
+    user_last_names = draw(_LAST, count)
+    bio_interests = draw(_INTERESTS, (count, 2))
+    
     # Generate basic user data
     for i in range(count):
-        first_name = random.choice(first_names)
-        last_name = random.choice(last_names)
-        name = f"{first_name} {last_name}"
+        first_name = user_first_names[i]
+        name = f"{first_name} {user_last_names[i]}"
         
         user = {
             # Let the API create the UID
             "display_name": name,
             "email": generate_email(name),
-            "bio": f"Hi, I'm {first_name}. I enjoy {random.choice(interests)} and {random.choice(interests)}.",
+            "bio": f"Hi, I'm {first_name}. I enjoy {bio_interests[i][0]} and {bio_interests[i][1]}.",
             "profile_image_url": f"https://randomuser.me/api/portraits/{'men' if i % 2 == 0 else 'women'}/{i % 100}.jpg"
         }
         users.append(user)
     
-    # Create users via API
-    created_users = []
-    for i, user in enumerate(users):
-        print(f"Creating user {i+1}/{count}: {user['display_name']}")
-        response = requests.post(f"{API_BASE_URL}/users", json=user)
-        created_user = print_response(response, f"Created user {user['display_name']}")
-        if created_user:
-            # Initialize an interests array for each user
-            created_user['interests'] = []
-            created_users.append(created_user)
-    
     # Assign interests to ensure overlapping
     print("\nAssigning interests to users...")
-    for i, user in enumerate(created_users):
-        # Every user gets 2-5 interests
-        # Ensure there's some overlap with other users
-        user_interests = generate_random_interests(2, 5)
-        
-        # Ensure some overlap with the next user (circular)
-        next_user_index = (i + 1) % len(created_users)
-        if i < len(created_users) - 1:
-            # Add 1-2 shared interests with the next user
-            shared_count = random.randint(1, 2)
-            if len(user_interests) > shared_count:
-                shared_interests = random.sample(user_interests, shared_count)
-                # These will be used for the next user
-                created_users[next_user_index]['temp_shared'] = shared_interests
-        
-        # Include shared interests from previous user
-        if 'temp_shared' in user:
-            for interest in user['temp_shared']:
-                if interest not in user_interests:
-                    user_interests.append(interest)
-            del user['temp_shared']
-        
-        print(f"Setting interests for {user['display_name']}: {user_interests}")
-        response = requests.post(
-            f"{API_BASE_URL}/users/{user['uid']}/interests", 
-            json={"interests": user_interests}
-        )
-        if print_response(response, f"Updated interests for {user['display_name']}"):
+    # Every user gets 2-5 interests
+    base_interests = [generate_random_interests(2, 5) for _ in users]
+    for user, user_interests in zip(users, base_interests):
+        user['interests'] = list(user_interests)
+    
+    # Ensure some overlap with other users: each user shares 1-2 of their
+    # own interests with the next user, all before any API calls
+    for i in range(len(users) - 1):
+        shared_count = random.randint(1, 2)
+        if len(base_interests[i]) > shared_count:
+            next_interests = users[i + 1]['interests']
+            for interest in random.sample(base_interests[i], shared_count):
+                if interest not in next_interests:
+                    next_interests.append(interest)
+    
+    for user in users:
+        print(f"Interests for {user['display_name']}: {user['interests']}")
+    
+    # Create users with their interests via API (results come back in input order)
+    print(f"Creating {count} users...")
+    results = bulk_create_users(users)
+    created_users = []
+    for user, created_user in zip(users, results):
+        if created_user:
             # Store the interests in our local user object
-            user['interests'] = user_interests
+            created_user['interests'] = user['interests']
+            created_user['interest_set'] = frozenset(user['interests'])
+            created_users.append(created_user)
     
     print(f"Created {len(created_users)} users successfully")
     return created_users
@@ -230,6 +408,10 @@ def create_events(count=5, users=None):
         # Divide the event duration into roughly equal segments
         segment_duration = duration_hours / num_items
         
+        # Draw session types and speaker names for every item in one batch
+        item_types = draw(_SESSION_TYPES, num_items)
+        speaker_names = random_full_names(num_items)
+        
         for j in range(num_items):
             # Calculate segment boundaries
             segment_start = start_time + timedelta(hours=j * segment_duration)
@@ -260,52 +442,52 @@ def create_events(count=5, users=None):
                     print(f"⚠️ Could not create valid schedule item. Skipping...")
                     continue
             
-            print(f"  Schedule item {j+1}: {item_start.strftime('%H:%M')} - {item_end.strftime('%H:%M')}")
+            # Format each boundary once; the log line reuses the HH:MM slice of the ISO string
+            item_start_iso = item_start.isoformat()
+            item_end_iso = item_end.isoformat()
+            print(f"  Schedule item {j+1}: {item_start_iso[11:16]} - {item_end_iso[11:16]}")
             
             schedule_items.append({
-                "title": f"Session {j+1}: {random.choice(['Workshop', 'Talk', 'Panel', 'Networking'])}",
-                "speaker_name": f"{random.choice(first_names)} {random.choice(last_names)}",
+                "title": f"Session {j+1}: {item_types[j]}",
+                "speaker_name": speaker_names[j],
                 "description": "Session description goes here.",
-                "start_time": item_start.isoformat(),
-                "end_time": item_end.isoformat()
+                "start_time": item_start_iso,
+                "end_time": item_end_iso
             })
         
+        # Format the event boundaries once for both the payload and the log lines
+        start_iso = start_time.isoformat()
+        end_iso = end_time.isoformat()
+        
         # Create the event data
         event_data = {
-            "title": event_titles[i],
-            "description": event_descriptions[i],
-            "start_time": start_time.isoformat(),
-            "end_time": end_time.isoformat(),
+            **_EVENT_SKELETONS[i],
+            "start_time": start_iso,
+            "end_time": end_iso,
             "venue": {
                 "name": f"Venue {i+1}",
                 "address": f"{random.randint(100, 999)} Main St, Goa, India",
                 "latitude": lat,
                 "longitude": lng
             },
-            "category": event_categories[i],
-            "image_url": f"https://picsum.photos/800/600?random={i}",
             "price": random.choice([0, 0, 10.99, 25.50, 49.99]),
-            "organizer_name": f"{random.choice(first_names)} {random.choice(last_names)}",
-            "organizer_email": "organizer@example.com",
+            "organizer_name": random_full_names(1)[0],
             "organizer_phone": f"555-{random.randint(100, 999)}-{random.randint(1000, 9999)}",
             "schedule": schedule_items
         }
         
         print(f"Creating event {i+1}/{count}: {event_data['title']}")
-        print(f"Event time: {start_time.strftime('%Y-%m-%d %H:%M')} to {end_time.strftime('%Y-%m-%d %H:%M')}")
+        print(f"Event time: {start_iso[:16].replace('T', ' ')} to {end_iso[:16].replace('T', ' ')}")
         print(f"Event location: {lat:.6f}, {lng:.6f}")
         
         # Create event
-        response = requests.post(f"{API_BASE_URL}/events", json=event_data)
+        response = post_json(f"{API_BASE_URL}/events", event_data)
         created_event = print_response(response, f"Created event {event_data['title']}")
         
         if created_event:
-            print(f"Waiting 20 seconds to verify event creation...")
-            time.sleep(20)
-            
-            # Verify event exists by fetching details
+            # Verify event exists by polling its details until it shows up
             print(f"Verifying event {created_event['id']} exists...")
-            verify_response = requests.get(f"{API_BASE_URL}/events/{created_event['id']}")
+            verify_response = wait_for_event(created_event['id'])
             verified_event = print_response(verify_response, f"Verified event {event_data['title']}")
             
             if verified_event:
@@ -317,41 +499,7 @@ def create_events(count=5, users=None):
                     # Random sample of 5-15 users to attend this event
                     attending_users = random.sample(users, min(random.randint(5, 15), len(users)))
                     
-                    for user in attending_users:
-                        print(f"Adding RSVP for {user['display_name']} to {verified_event['title']}")
-                        
-                        # Try with a simple RSVP payload and explicit headers
-                        rsvp_data = {
-                            "status": "attending"
-                        }
-                        
-                        try:
-                            # Log detailed request information
-                            rsvp_url = f"{API_BASE_URL}/events/{verified_event['id']}/rsvp?user_id={user['uid']}"
-                            print(f"Making RSVP request to: {rsvp_url}")
-                            print(f"With data: {rsvp_data}")
-                            
-                            # Add a delay between requests to avoid overwhelming the server
-                            time.sleep(1)
-                            
-                            # Make request with explicit content-type header
-                            headers = {"Content-Type": "application/json"}
-                            rsvp_response = requests.post(rsvp_url, json=rsvp_data, headers=headers)
-                            
-                            # Detailed logging for any error
-                            if rsvp_response.status_code >= 400:
-                                print(f"RSVP Error details:")
-                                print(f"Status code: {rsvp_response.status_code}")
-                                print(f"Response headers: {dict(rsvp_response.headers)}")
-                                try:
-                                    print(f"Response content: {rsvp_response.text}")
-                                except:
-                                    print("Could not print response content")
-                            
-                            print_response(rsvp_response, f"Added RSVP for {user['display_name']}")
-                            
-                        except Exception as e:
-                            print(f"❌ Exception while making RSVP request: {str(e)}")
+                    bulk_add_rsvps(verified_event, attending_users)
             else:
                 print(f"⚠️ Event {created_event['id']} could not be verified! Skipping RSVPs.")
     
@@ -362,15 +510,20 @@ def create_connections(users):
     """Create connections between users with mutual interests"""
     print(f"\n{'=' * 50}\nGENERATING CONNECTIONS\n{'=' * 50}")
     
-    connection_count = 0
+    planned = []
+    
+    # Index users by interest so mutual-interest lookups don't scan every pair
+    users_by_uid = {user['uid']: user for user in users}
+    by_interest = defaultdict(set)
+    for user in users:
+        for interest in user['interest_set']:
+            by_interest[interest].add(user['uid'])
     
     # Each user will send 3-5 connection requests (or as many as possible with mutual interests)
     for user in users:
         # Find all users with at least one mutual interest
-        potential_connections = []
-        for other_user in users:
-            if other_user['uid'] != user['uid'] and check_mutual_interests(user['interests'], other_user['interests']):
-                potential_connections.append(other_user)
+        potential = set().union(*(by_interest[i] for i in user['interest_set'])) - {user['uid']}
+        potential_connections = [users_by_uid[uid] for uid in sorted(potential)]
         
         if not potential_connections:
             print(f"⚠️ No users with mutual interests found for {user['display_name']}")
@@ -380,53 +533,20 @@ def create_connections(users):
         request_count = min(random.randint(3, 5), len(potential_connections))
         to_connect = random.sample(potential_connections, request_count)
         
-        for other_user in to_connect:
-            mutual = set(user['interests']) & set(other_user['interests'])
-            print(f"Creating connection request: {user['display_name']} -> {other_user['display_name']}")
-            print(f"  Mutual interests: {', '.join(mutual)}")
-            
-            connection_data = {
-                "from_user_id": user['uid'],
-                "to_user_id": other_user['uid']
-            }
-            
-            response = requests.post(f"{API_BASE_URL}/connections/request", json=connection_data)
-            connection_result = print_response(
-                response, 
-                f"Created connection request from {user['display_name']} to {other_user['display_name']}"
-            )
-            
-            if connection_result:
-                # 70% chance to accept the connection after a delay
-                if random.random() < 0.7:
-                    # Wait 5-10 seconds before accepting
-                    delay = random.uniform(5, 10)
-                    print(f"Waiting {delay:.1f} seconds before accepting connection...")
-                    time.sleep(delay)
-                    
-                    # Accept the connection - FIXED to match the API expectation
-                    print(f"{other_user['display_name']} is accepting connection from {user['display_name']}")
-                    
-                    # The API expects a ConnectionResponse model with:
-                    # - request_id: the ID of the user who SENT the request
-                    # - user_id: the ID of the user RESPONDING to the request
-                    # - status: "accept" or "decline"
-                    accept_data = {
-                        "request_id": user['uid'],     # ID of the user who sent the request
-                        "user_id": other_user['uid'],  # ID of the user accepting the request
-                        "status": "accept"
-                    }
-                    
-                    # Use the "find" endpoint which looks up by user IDs instead of connection ID
-                    accept_response = requests.post(
-                        f"{API_BASE_URL}/connections/respond/find", 
-                        json=accept_data
-                    )
-                    print_response(
-                        accept_response, 
-                        f"{other_user['display_name']} accepted connection from {user['display_name']}"
-                    )
-                connection_count += 1
+        # Decide up front which requests get accepted (70% chance each)
+        planned.append((user, [(other_user, random.random() < 0.7) for other_user in to_connect]))
+    
+    # Send every planned request in bulk, then accept the ones picked above
+    pairs = [(user, other_user, accept) for user, to_connect in planned for other_user, accept in to_connect]
+    results = bulk_connection_requests([(user, other_user) for user, other_user, _ in pairs])
+    connection_count = sum(1 for result in results if result)
+    accepted = [
+        (user, other_user)
+        for (user, other_user, accept), result in zip(pairs, results)
+        if result and accept
+    ]
+    if accepted:
+        respond_to_connections(accepted)
     
     print(f"Created {connection_count} connections")
 
@@ -434,33 +554,24 @@ def create_feedback(users, events):
     """Create feedback for events"""
     print(f"\n{'=' * 50}\nGENERATING EVENT FEEDBACK\n{'=' * 50}")
     
-    feedback_count = 0
+    submissions = []
     
     for event in events:
         # Get 2-5 random users to provide feedback
-        feedback_users = random.sample(users, min(random.randint(2, 5), len(users)))
+        feedback_count = min(random.randint(2, 5), len(users))
+        user_indices = _RNG.choice(len(users), size=feedback_count, replace=False).tolist()
+        ratings = _RNG.integers(3, 5, endpoint=True, size=feedback_count).tolist()  # Mostly positive ratings
+        comments = draw(_FEEDBACK_COMMENTS, feedback_count)
         
-        for user in feedback_users:
-            print(f"Creating feedback from {user['display_name']} for {event['title']}")
-            
+        for index, rating, comment in zip(user_indices, ratings, comments):
             feedback_data = {
-                "rating": random.randint(3, 5),  # Mostly positive ratings
-                "comment": random.choice([
-                    "Really enjoyed this event!",
-                    "Great organization and content.",
-                    "Would definitely attend again.",
-                    "Excellent speakers and venue.",
-                    "Learned a lot from this event."
-                ])
+                "rating": rating,
+                "comment": comment
             }
-            
-            response = requests.post(
-                f"{API_BASE_URL}/feedback/{event['id']}?user_id={user['uid']}", 
-                json=feedback_data
-            )
-            
-            if print_response(response, f"Created feedback from {user['display_name']} for {event['title']}"):
-                feedback_count += 1
+            submissions.append((event, users[index], feedback_data))
+    
+    # Flattened (event, user) submissions are independent, so send them concurrently
+    feedback_count = sum(EXECUTOR.map(lambda submission: submit_feedback(*submission), submissions))
     
     print(f"Created {feedback_count} feedback entries")
 
@@ -468,21 +579,11 @@ def update_user_locations(users):
     """Update random locations for users"""
     print(f"\n{'=' * 50}\nUPDATING USER LOCATIONS\n{'=' * 50}")
     
-    for user in users:
-        # Generate a random location within 15km of base location in Goa
-        lat, lng = generate_location_near_base()
-        
-        location_data = {
-            "latitude": lat,
-            "longitude": lng
-        }
-        
-        print(f"Updating location for {user['display_name']}: {lat:.6f}, {lng:.6f}")
-        response = requests.post(
-            f"{API_BASE_URL}/users/{user['uid']}/location", 
-            json=location_data
-        )
-        print_response(response, f"Updated location for {user['display_name']}")
+    # Generate a random location within 15km of base location in Goa for each user
+    lats = (BASE_LATITUDE + _RNG.uniform(-_LAT_OFFSET_RANGE, _LAT_OFFSET_RANGE, size=len(users))).tolist()
+    lngs = (BASE_LONGITUDE + _RNG.uniform(-_LON_OFFSET_RANGE, _LON_OFFSET_RANGE, size=len(users))).tolist()
+    
+    bulk_update_locations(users, lats, lngs)
 
 def main():
     print(f"\n{'=' * 50}\nEVENTMESH DATA GENERATION SCRIPT\n{'=' * 50}")
@@ -1,43 +1,82 @@
+import logging
 import requests
+import numpy as np
+import asyncio
+import aiohttp
 import random
-import json
+import sys
+import orjson
 import time
 from datetime import datetime, timedelta
 from math import cos, pi
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
 
 API_BASE_URL = "http://localhost:8000/api"
 
+# Progress goes through a named logger; per-item detail is DEBUG only
+log = logging.getLogger("mockgen")
+
+# Section banner rule
+_RULE = "=" * 50
+
 # Reference location: Goa, India
 BASE_LATITUDE = 15.421042
 BASE_LONGITUDE = 73.980793
 MAX_DISTANCE_KM = 15
 
+# Offset ranges in degrees for MAX_DISTANCE_KM around the base location
+# Approximate conversion: 1 degree latitude = 111 km
+# Longitude conversion varies with latitude due to the Earth's curvature
+_LAT_OFFSET_RANGE = MAX_DISTANCE_KM / 111.0
+_LON_OFFSET_RANGE = MAX_DISTANCE_KM / (111.0 * cos(BASE_LATITUDE * pi / 180))
+
+# Shared HTTP session so concurrent calls reuse pooled keep-alive connections
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=0)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+SESSION.headers.update({"Content-Type": "application/json"})
+
+# Worker count for concurrent RSVP requests (sized below the session pool)
+RSVP_WORKERS = 32
+
+# RSVP URL template and payload are constant, so build them once
+RSVP_URL = API_BASE_URL + "/events/{event_id}/rsvp?user_id={user_id}"
+RSVP_DATA = {"status": "attending"}
+RSVP_BODY = orjson.dumps(RSVP_DATA)
+
+# Fixed schedule item description
+_SCHEDULE_ITEM_DESC = "Session description goes here."
+
+# Sample data is read-only: tuples of interned strings
 # Provided interests
-interests = [
+interests = tuple(sys.intern(s) for s in (
     "tech", "music", "art", "food", "sports", "gaming", 
     "photography", "fashion", "literature", "science", 
     "movies", "travel", "fitness", "business", "education"
-]
+))
 
 # New sample names for users
-first_names = [
+first_names = tuple(sys.intern(s) for s in (
     "Rohan", "Priya", "Vikram", "Neha", "Arjun", "Meera", "Raj", "Ananya", "Karan", "Divya",
     "Aryan", "Aisha", "Nikhil", "Tanya", "Aditya", "Zara", "Kabir", "Nisha", "Rahul", "Maya",
     "Varun", "Pooja", "Sahil", "Kavya", "Rishi", "Isha", "Aarush", "Sanya", "Dev", "Kiara",
     "Rohit", "Anjali", "Vihaan", "Kritika", "Shaurya", "Deepika", "Yash", "Anushka", "Armaan", "Riya",
     "Mihir", "Anika", "Vivaan", "Tanvi", "Aarav", "Ishita", "Dhruv", "Sana", "Rishaan", "Shreya"
-]
+))
 
-last_names = [
+last_names = tuple(sys.intern(s) for s in (
     "Sharma", "Patel", "Singh", "Verma", "Gupta", "Kapoor", "Kumar", "Joshi", "Shah", "Reddy",
     "Bose", "Malhotra", "Banerjee", "Khanna", "Agarwal", "Iyer", "Chatterjee", "Mathur", "Nair", "Menon",
     "Rao", "Desai", "Mehta", "Chauhan", "Chopra", "Jain", "Das", "Kaur", "Mukherjee", "Gandhi",
     "Shetty", "Bhatia", "Roy", "Garg", "Sinha", "Trivedi", "Malik", "Saxena", "Suri", "Ahuja",
     "Sachdeva", "Lal", "Bhatt", "Rajput", "Thakur", "Arora", "Pradhan", "Tiwari", "Srivastava", "Chaudhry"
-]
+))
 
 # New sample event titles
-event_titles = [
+event_titles = tuple(sys.intern(s) for s in (
     "Innovation Conference 2023",
     "Monsoon Music Festival",
     "Cultural Heritage Exhibition",
@@ -53,26 +92,26 @@ event_titles = [
     "Photography Exhibition: Coastal Life",
     "Dance & Music Celebration",
     "Adventure Sports Weekend"
-]
+))
 
 # New event categories
-event_categories = [
-    ["tech", "business", "education"],
-    ["music", "art", "entertainment"],
-    ["art", "culture", "history"],
-    ["fitness", "wellness", "health"],
-    ["food", "travel", "culture"],
-    ["tech", "business", "social"],
-    ["business", "tech", "education"],
-    ["literature", "art", "education"],
-    ["science", "environment", "education"],
-    ["fitness", "health", "wellness"],
-    ["business", "tech", "education"],
-    ["tech", "science", "education"],
-    ["photography", "art", "culture"],
-    ["music", "art", "entertainment"],
-    ["sports", "fitness", "travel"]
-]
+event_categories = tuple(tuple(sys.intern(s) for s in c) for c in (
+    ("tech", "business", "education"),
+    ("music", "art", "entertainment"),
+    ("art", "culture", "history"),
+    ("fitness", "wellness", "health"),
+    ("food", "travel", "culture"),
+    ("tech", "business", "social"),
+    ("business", "tech", "education"),
+    ("literature", "art", "education"),
+    ("science", "environment", "education"),
+    ("fitness", "health", "wellness"),
+    ("business", "tech", "education"),
+    ("tech", "science", "education"),
+    ("photography", "art", "culture"),
+    ("music", "art", "entertainment"),
+    ("sports", "fitness", "travel")
+))
 
 # New event descriptions
 event_descriptions = [
@@ -93,37 +132,97 @@ event_descriptions = [
     "Challenge yourself with thrilling adventure activities including paragliding, trekking, and water sports."
 ]
 
+# Lowercased name tokens so emails are built without per-user .lower() calls
+_FIRST_LOWER = [name.lower() for name in first_names]
+_LAST_LOWER = [name.lower() for name in last_names]
+
+# Feedback comments for positive (3-5 star) and negative (1-2 star) ratings
+POS_COMMENTS = (
+    "Really enjoyed this event!",
+    "Great organization and content.",
+    "Would definitely attend again.",
+    "Excellent speakers and venue.",
+    "Learned a lot from this event."
+)
+NEG_COMMENTS = (
+    "Poor organization, would not recommend.",
+    "The content was disappointing.",
+    "Too crowded and poorly managed.",
+    "Speakers were not prepared well.",
+    "Not worth the price of admission.",
+    "Schedule was not followed properly."
+)
+
+# Event ticket prices (free events are twice as likely)
+PRICES = [0, 0, 10.99, 25.50, 49.99]
+
+# Schedule session types
+SESSION_TYPES = ["Workshop", "Talk", "Panel", "Networking"]
+
+# Shared NumPy generator for drawing batches of random values in one call
+RNG = np.random.default_rng()
+
 # Helper functions
+def sample_users(users, k):
+    """Pick k distinct random users"""
+    return [users[i] for i in RNG.choice(len(users), size=k, replace=False).tolist()]
+
 def generate_random_interests(min_count=2, max_count=5):
     """Generate a random set of interests"""
     count = random.randint(min_count, max_count)
     return random.sample(interests, count)
 
-def generate_email(name):
-    """Generate an email from a name"""
-    return f"{name.lower().replace(' ', '.')}@example.com"
+def _json(response):
+    """Parse a requests response body with orjson"""
+    return orjson.loads(response.content)
 
 def format_error(response):
     """Format error response for printing"""
     try:
-        return f"Error: {response.status_code} - {response.json()}"
+        return f"Error: {response.status_code} - {_json(response)}"
     except:
         return f"Error: {response.status_code} - {response.text}"
 
 def print_response(response, action_msg):
     """Print API response with action message"""
     if response.status_code >= 200 and response.status_code < 300:
-        print(f"✅ {action_msg} - Status: {response.status_code}")
-        return response.json()
+        log.info("✅ %s - Status: %s", action_msg, response.status_code)
+        return _json(response)
+    else:
+        log.error("❌ %s - Status: %s", action_msg, response.status_code)
+        log.error("%s", format_error(response))
+        return None
+
+async def print_response_async(response, action_msg):
+    """Print an aiohttp API response with action message"""
+    if response.status >= 200 and response.status < 300:
+        log.info("✅ %s - Status: %s", action_msg, response.status)
+        return await response.json(loads=orjson.loads)
     else:
-        print(f"❌ {action_msg} - Status: {response.status_code}")
-        print(format_error(response))
+        log.error("❌ %s - Status: %s", action_msg, response.status)
+        log.error("Error: %s - %s", response.status, await response.text())
         return None
 
-def check_mutual_interests(user1_interests, user2_interests):
-    """Check if two users have at least two mutual interests"""
-    mutual = set(user1_interests) & set(user2_interests)
-    return len(mutual) >= 2
+async def post_async(session, sem, url, payload, action_msg):
+    """POST a JSON payload, holding the semaphore until the response is handled
+    
+    Payloads that are already serialized bytes are sent as-is.
+    """
+    if not isinstance(payload, bytes):
+        payload = orjson.dumps(payload)
+    async with sem:
+        async with session.post(url, data=payload) as response:
+            return await print_response_async(response, action_msg)
+
+async def post_many_async(items):
+    """POST (url, payload, action_msg) items concurrently, returning results in input order"""
+    sem = asyncio.Semaphore(32)
+    connector = aiohttp.TCPConnector(limit=64, keepalive_timeout=30)
+    async with aiohttp.ClientSession(connector=connector, headers={"Content-Type": "application/json"}) as session:
+        return await asyncio.gather(*(
+            post_async(session, sem, url, payload, action_msg)
+            for url, payload, action_msg in items
+        ))
 
 def validate_event_times(start_time, end_time, min_duration_hours=8):
     """Validate that event times are correct with minimum duration"""
@@ -137,331 +236,250 @@ def validate_event_times(start_time, end_time, min_duration_hours=8):
     duration = end_time - start_time
     return duration >= timedelta(hours=min_duration_hours)
 
-def validate_schedule_item_times(item_start, item_end, event_start, event_end):
-    """Validate that schedule item times are within event boundaries"""
-    if not isinstance(item_start, datetime) or not isinstance(item_end, datetime):
-        return False
+def generate_locations_near_base(n):
+    """Generate n random locations within MAX_DISTANCE_KM of base coordinates in one batch"""
+    lat = BASE_LATITUDE + RNG.uniform(-_LAT_OFFSET_RANGE, _LAT_OFFSET_RANGE, n)
+    lng = BASE_LONGITUDE + RNG.uniform(-_LON_OFFSET_RANGE, _LON_OFFSET_RANGE, n)
+    return list(zip(lat.tolist(), lng.tolist()))
+
+def _post_rsvp(session, event, user):
+    """Send one attending RSVP for a user to an event"""
+    return session.post(RSVP_URL.format(event_id=event['id'], user_id=user['uid']), data=RSVP_BODY)
+
+def _wait_for_event(event_id, session, timeout=10.0):
+    """Poll an event with exponential backoff until it exists or the timeout expires
     
-    if item_start >= item_end:
-        return False
+    Returns the last response so the caller can report success or failure.
+    """
+    deadline = time.monotonic() + timeout
+    for delay in (0.05, 0.1, 0.2, 0.4, 0.8, 1.6, 3.2):
+        response = session.get(f"{API_BASE_URL}/events/{event_id}")
+        remaining = deadline - time.monotonic()
+        if response.ok or remaining <= 0:
+            return response
+        time.sleep(min(delay, remaining))
+    return session.get(f"{API_BASE_URL}/events/{event_id}")
+
+def _make_schedule(start_time, end_time, duration_hours, num_items, rng):
+    """Build schedule items spread over roughly equal segments of the event"""
+    # Divide the event duration into equal segments, in seconds from the event start
+    segment_secs = duration_hours * 3600 // num_items
+    seg_starts = np.arange(num_items) * segment_secs
     
-    # Check if schedule item is contained within event times
-    if item_start < event_start or item_end > event_end:
-        return False
+    # Draw every item's randomness in one batch each
+    buffer = int(min(60, segment_secs / 60 * 0.2))  # 20% of segment as buffer in minutes
+    offsets = rng.integers(0, buffer + 1, size=num_items) * 60
+    # Duration between 45-90 minutes, ending at least 10 minutes before the segment ends
+    max_durations = np.maximum(45, np.minimum(90, (segment_secs - offsets) // 60 - 10))
+    durations = rng.integers(45, max_durations + 1) * 60
+    types = rng.integers(0, len(SESSION_TYPES), size=num_items).tolist()
+    speaker_first = rng.integers(0, len(first_names), size=num_items).tolist()
+    speaker_last = rng.integers(0, len(last_names), size=num_items).tolist()
+    
+    # Items are valid by construction: each one starts and ends inside its own segment
+    start_secs = seg_starts + offsets
+    end_secs = start_secs + durations
+    assert int(end_secs[-1]) <= duration_hours * 3600
+    # Offset from the event's epoch seconds and convert each boundary once
+    start_ts = int(start_time.timestamp())
+    starts = [datetime.fromtimestamp(ts) for ts in (start_ts + start_secs).tolist()]
+    ends = [datetime.fromtimestamp(ts) for ts in (start_ts + end_secs).tolist()]
+    
+    schedule_items = []
+    for j, (item_start, item_end) in enumerate(zip(starts, ends)):
+        log.debug("  Schedule item %d: %s - %s", j + 1, item_start.strftime('%H:%M'), item_end.strftime('%H:%M'))
+        
+        schedule_items.append({
+            "title": f"Session {j+1}: {SESSION_TYPES[types[j]]}",
+            "speaker_name": f"{first_names[speaker_first[j]]} {last_names[speaker_last[j]]}",
+            "description": _SCHEDULE_ITEM_DESC,
+            "start_time": item_start.isoformat(),
+            "end_time": item_end.isoformat()
+        })
     
-    return True
+    return schedule_items
 
-def generate_location_near_base(max_distance_km=MAX_DISTANCE_KM):
-    """Generate a random location within specified distance of base coordinates"""
-    # Convert max distance from km to degrees
-    # Approximate conversion: 1 degree latitude = 111 km
-    # Longitude conversion varies with latitude due to the Earth's curvature
-    lat_offset_range = max_distance_km / 111.0
+def _build_event(i, when, now, location, rng):
+    """Build the payload for event i, dated in the past or the future"""
+    days = int(rng.integers(1, 31))
+    hours = int(rng.integers(0, 13))
+    sign = -1 if when == "past" else 1
+    # Generate random start time within 30 days of now, on a whole second so the
+    # schedule's integer epoch offsets never start before it
+    start_time = (now + sign * timedelta(days=days, hours=hours)).replace(microsecond=0)
+    
+    # Ensure event lasts at least 8 hours
+    duration_hours = int(rng.integers(8, 13))  # Between 8-12 hours
+    end_time = start_time + timedelta(hours=duration_hours)
+    
+    # Validate event times
+    if not validate_event_times(start_time, end_time):
+        log.warning("⚠️ Invalid event times generated for %s. Regenerating...", event_titles[i])
+        # Adjust end_time to ensure it's valid
+        end_time = start_time + timedelta(hours=8)
+    
+    if when == "past":
+        log.info("Past event duration: %s hours, %s days ago", duration_hours, days)
+    else:
+        log.info("Future event duration: %s hours", duration_hours)
+    
+    # Venue within 15km of base location
+    lat, lng = location
     
-    # Adjust longitude range based on latitude (Earth narrows at higher latitudes)
-    # cos(latitude in radians) gives the adjustment factor
-    lon_offset_range = max_distance_km / (111.0 * cos(BASE_LATITUDE * pi / 180))
+    # Create a schedule with 3-5 items distributed throughout the event
+    num_items = int(rng.integers(3, 6))
+    schedule_items = _make_schedule(start_time, end_time, duration_hours, num_items, rng)
+    
+    # Past events have organizer@example.com, future ones a different organizer email
+    if when == "past":
+        organizer_email = "organizer@example.com"
+    else:
+        organizer_email = f"{first_names[int(rng.integers(0, len(first_names)))].lower()}.organizer@eventmesh.com"
     
-    # Generate random offsets within range
-    lat_offset = random.uniform(-lat_offset_range, lat_offset_range)
-    lon_offset = random.uniform(-lon_offset_range, lon_offset_range)
+    # Create the event data
+    event_data = {
+        "title": event_titles[i],
+        "description": event_descriptions[i],
+        "start_time": start_time.isoformat(),
+        "end_time": end_time.isoformat(),
+        "venue": {
+            "name": f"Venue {i+1}",
+            "address": f"{int(rng.integers(100, 1000))} Main St, Goa, India",
+            "latitude": lat,
+            "longitude": lng
+        },
+        "category": event_categories[i],
+        "image_url": f"https://picsum.photos/800/600?random={i}",
+        "price": PRICES[int(rng.integers(0, len(PRICES)))],
+        "organizer_name": f"{first_names[int(rng.integers(0, len(first_names)))]} {last_names[int(rng.integers(0, len(last_names)))]}",
+        "organizer_email": organizer_email,
+        "organizer_phone": f"555-{int(rng.integers(100, 1000))}-{int(rng.integers(1000, 10000))}",
+        "schedule": schedule_items
+    }
     
-    # Add offsets to base coordinates
-    lat = BASE_LATITUDE + lat_offset
-    lng = BASE_LONGITUDE + lon_offset
+    log.info("Creating %s event %d: %s", when, i + 1, event_data['title'])
+    log.info("Event time: %s to %s", start_time.strftime('%Y-%m-%d %H:%M'), end_time.strftime('%Y-%m-%d %H:%M'))
+    log.info("Event location: %.6f, %.6f", lat, lng)
     
-    return lat, lng
+    return event_data
 
 # Main functions
-def create_users(count=150):
-    """Create users with overlapping interests"""
-    print(f"\n{'=' * 50}\nGENERATING {count} USERS\n{'=' * 50}")
-    
-    users = []
-    # Generate basic user data
-    for i in range(count):
-        first_name = random.choice(first_names)
-        last_name = random.choice(last_names)
-        name = f"{first_name} {last_name}"
-        
-        user = {
+async def create_users_async(count=150):
+    """Create users with overlapping interests, overlapping the API round-trips"""
+    log.info("\n%s\nGENERATING %s USERS\n%s", _RULE, count, _RULE)
+    
+    # Draw every user's name and bio interest indices in one batch each
+    first_idx = RNG.integers(0, len(first_names), size=count).tolist()
+    last_idx = RNG.integers(0, len(last_names), size=count).tolist()
+    i1 = RNG.integers(0, len(interests), size=count).tolist()
+    i2 = RNG.integers(0, len(interests), size=count).tolist()
+    
+    # Generate basic user data from the drawn indices
+    names = [f"{first_names[a]} {last_names[b]}" for a, b in zip(first_idx, last_idx)]
+    emails = [f"{_FIRST_LOWER[a]}.{_LAST_LOWER[b]}@example.com" for a, b in zip(first_idx, last_idx)]
+    bios = [f"Hi, I'm {first_names[a]}. I enjoy {interests[c]} and {interests[d]}." for a, c, d in zip(first_idx, i1, i2)]
+    image_urls = [
+        f"https://randomuser.me/api/portraits/{'men' if i % 2 == 0 else 'women'}/{i % 100}.jpg"
+        for i in range(count)
+    ]
+    users = [
+        {
             # Let the API create the UID
             "display_name": name,
-            "email": generate_email(name),
-            "bio": f"Hi, I'm {first_name}. I enjoy {random.choice(interests)} and {random.choice(interests)}.",
-            "profile_image_url": f"https://randomuser.me/api/portraits/{'men' if i % 2 == 0 else 'women'}/{i % 100}.jpg"
+            "email": email,
+            "bio": bio,
+            "profile_image_url": image_url
         }
-        users.append(user)
-    
-    # Create users via API
-    created_users = []
-    for i, user in enumerate(users):
-        print(f"Creating user {i+1}/{count}: {user['display_name']}")
-        response = requests.post(f"{API_BASE_URL}/users", json=user)
-        created_user = print_response(response, f"Created user {user['display_name']}")
-        if created_user:
-            # Initialize an interests array for each user
-            created_user['interests'] = []
-            created_users.append(created_user)
-    
-    # Assign interests to ensure overlapping
-    print("\nAssigning interests to users...")
-    for i, user in enumerate(created_users):
+        for name, email, bio, image_url in zip(names, emails, bios, image_urls)
+    ]
+    
+    # Bound in-flight requests so the API isn't flooded
+    sem = asyncio.Semaphore(32)
+    connector = aiohttp.TCPConnector(limit=64, keepalive_timeout=30)
+    async with aiohttp.ClientSession(connector=connector, headers={"Content-Type": "application/json"}) as session:
+        # Create users via API (gather keeps results in input order)
+        log.info("Creating %s users...", count)
+        results = await asyncio.gather(*(
+            post_async(session, sem, f"{API_BASE_URL}/users", user, f"Created user {user['display_name']}")
+            for user in users
+        ))
+        created_users = []
+        for created_user in results:
+            if created_user:
+                # Initialize an interests array for each user
+                created_user['interests'] = []
+                created_user['interest_set'] = frozenset()
+                created_users.append(created_user)
+        
+        # Assign interests to ensure overlapping
+        log.info("\nAssigning interests to users...")
         # Every user gets 3-6 interests (increased to ensure more overlaps)
-        user_interests = generate_random_interests(3, 6)
+        n = len(created_users)
+        base_interests = [generate_random_interests(3, 6) for _ in range(n)]
         
-        # Ensure some overlap with the next user (circular)
-        next_user_index = (i + 1) % len(created_users)
-        if i < len(created_users) - 1:
-            # Add 2-3 shared interests with the next user
+        # Ensure some overlap with the next user: 2-3 of each user's base interests
+        # are passed on to their successor (the last user passes nothing on)
+        shared_chain = [[] for _ in range(n)]
+        for i in range(n - 1):
             shared_count = random.randint(2, 3)
-            if len(user_interests) > shared_count:
-                shared_interests = random.sample(user_interests, shared_count)
-                # These will be used for the next user
-                created_users[next_user_index]['temp_shared'] = shared_interests
+            if len(base_interests[i]) > shared_count:
+                shared_chain[i + 1] = random.sample(base_interests[i], shared_count)
         
-        # Include shared interests from previous user
-        if 'temp_shared' in user:
-            for interest in user['temp_shared']:
-                if interest not in user_interests:
-                    user_interests.append(interest)
-            del user['temp_shared']
+        # Merge own and inherited interests, keeping order and dropping duplicates
+        assigned_interests = [
+            list(dict.fromkeys(base + shared))
+            for base, shared in zip(base_interests, shared_chain)
+        ]
+        for user, user_interests in zip(created_users, assigned_interests):
+            log.info("Setting interests for %s: %s", user['display_name'], user_interests)
         
-        print(f"Setting interests for {user['display_name']}: {user_interests}")
-        response = requests.post(
-            f"{API_BASE_URL}/users/{user['uid']}/interests", 
-            json={"interests": user_interests}
-        )
-        if print_response(response, f"Updated interests for {user['display_name']}"):
+        # Only the overlap computation above is order dependent; the updates are not
+        results = await asyncio.gather(*(
+            post_async(
+                session, sem,
+                f"{API_BASE_URL}/users/{user['uid']}/interests",
+                {"interests": user_interests},
+                f"Updated interests for {user['display_name']}"
+            )
+            for user, user_interests in zip(created_users, assigned_interests)
+        ))
+    
+    for user, user_interests, updated in zip(created_users, assigned_interests, results):
+        if updated:
             # Store the interests in our local user object
             user['interests'] = user_interests
+            user['interest_set'] = frozenset(user_interests)
     
-    print(f"Created {len(created_users)} users successfully")
+    log.info("Created %d users successfully", len(created_users))
     return created_users
 
 def create_events(count=15, users=None):
     """Create events with schedules ensuring valid timing"""
-    print(f"\n{'=' * 50}\nGENERATING {count} EVENTS\n{'=' * 50}")
+    log.info("\n%s\nGENERATING %s EVENTS\n%s", _RULE, count, _RULE)
     
     events = []
     now = datetime.now()
     
-    # First 7 events will be in the past and have organizer@example.com
-    for i in range(min(7, count)):
-        # Generate random start time in the past 30 days
-        days_ago = random.randint(1, 30)
-        start_time = now - timedelta(days=days_ago, hours=random.randint(0, 12))
-        
-        # Ensure event lasts at least 8 hours
-        duration_hours = random.randint(8, 12)  # Between 8-12 hours
-        end_time = start_time + timedelta(hours=duration_hours)
-        
-        # Validate event times
-        if not validate_event_times(start_time, end_time):
-            print(f"⚠️ Invalid event times generated for {event_titles[i]}. Regenerating...")
-            # Adjust end_time to ensure it's valid
-            end_time = start_time + timedelta(hours=8)
-        
-        print(f"Past event duration: {duration_hours} hours, {days_ago} days ago")
-        
-        # Generate a venue within 15km of base location
-        lat, lng = generate_location_near_base()
-        
-        # Create a schedule with 3-5 items distributed throughout the event
-        schedule_items = []
-        num_items = random.randint(3, 5)
-        
-        # Divide the event duration into roughly equal segments
-        segment_duration = duration_hours / num_items
-        
-        for j in range(num_items):
-            # Calculate segment boundaries
-            segment_start = start_time + timedelta(hours=j * segment_duration)
-            segment_end = start_time + timedelta(hours=(j + 1) * segment_duration)
-            
-            # Add some randomness within the segment
-            buffer = min(60, segment_duration * 60 * 0.2)  # 20% of segment as buffer in minutes
-            item_start = segment_start + timedelta(minutes=random.randint(0, int(buffer)))
-            
-            # Duration between 45-90 minutes, but ensure it ends before segment end
-            max_duration = max(45, min(90, (segment_end - item_start).total_seconds() / 60 - 10))
-            item_duration = random.randint(45, int(max_duration))
-            item_end = item_start + timedelta(minutes=item_duration)
-            
-            # Validate schedule item times
-            if not validate_schedule_item_times(item_start, item_end, start_time, end_time):
-                print(f"⚠️ Invalid schedule item times. Adjusting...")
-                # Ensure item is within event boundaries
-                if item_start < start_time:
-                    item_start = start_time + timedelta(minutes=random.randint(10, 30))
-                if item_end > end_time:
-                    item_end = end_time - timedelta(minutes=random.randint(10, 30))
-                # Ensure item start is before end
-                if item_start >= item_end:
-                    item_end = item_start + timedelta(minutes=45)
-                # Final check
-                if not validate_schedule_item_times(item_start, item_end, start_time, end_time):
-                    print(f"⚠️ Could not create valid schedule item. Skipping...")
-                    continue
-            
-            print(f"  Schedule item {j+1}: {item_start.strftime('%H:%M')} - {item_end.strftime('%H:%M')}")
-            
-            schedule_items.append({
-                "title": f"Session {j+1}: {random.choice(['Workshop', 'Talk', 'Panel', 'Networking'])}",
-                "speaker_name": f"{random.choice(first_names)} {random.choice(last_names)}",
-                "description": "Session description goes here.",
-                "start_time": item_start.isoformat(),
-                "end_time": item_end.isoformat()
-            })
-        
-        # Create the event data
-        event_data = {
-            "title": event_titles[i],
-            "description": event_descriptions[i],
-            "start_time": start_time.isoformat(),
-            "end_time": end_time.isoformat(),
-            "venue": {
-                "name": f"Venue {i+1}",
-                "address": f"{random.randint(100, 999)} Main St, Goa, India",
-                "latitude": lat,
-                "longitude": lng
-            },
-            "category": event_categories[i],
-            "image_url": f"https://picsum.photos/800/600?random={i}",
-            "price": random.choice([0, 0, 10.99, 25.50, 49.99]),
-            "organizer_name": f"{random.choice(first_names)} {random.choice(last_names)}",
-            "organizer_email": "organizer@example.com",  # First 7 events have this email
-            "organizer_phone": f"555-{random.randint(100, 999)}-{random.randint(1000, 9999)}",
-            "schedule": schedule_items
-        }
-        
-        print(f"Creating past event {i+1}/7: {event_data['title']}")
-        print(f"Event time: {start_time.strftime('%Y-%m-%d %H:%M')} to {end_time.strftime('%Y-%m-%d %H:%M')}")
-        print(f"Event location: {lat:.6f}, {lng:.6f}")
-        
-        # Create event
-        response = requests.post(f"{API_BASE_URL}/events", json=event_data)
-        created_event = print_response(response, f"Created event {event_data['title']}")
-        
-        if created_event:
-            print(f"Waiting 10 seconds to verify event creation...")
-            time.sleep(10)
-            
-            # Verify event exists by fetching details
-            print(f"Verifying event {created_event['id']} exists...")
-            verify_response = requests.get(f"{API_BASE_URL}/events/{created_event['id']}")
-            verified_event = print_response(verify_response, f"Verified event {event_data['title']}")
-            
-            if verified_event:
-                events.append(verified_event)
+    # Generate every venue location within 15km of base location up front
+    locations = generate_locations_near_base(count)
     
-    # Remaining events will be in the future with different organizer emails
-    for i in range(7, count):
-        # Generate random start time in the next 30 days
-        start_time = now + timedelta(days=random.randint(1, 30), hours=random.randint(0, 12))
-        
-        # Ensure event lasts at least 8 hours
-        duration_hours = random.randint(8, 12)  # Between 8-12 hours
-        end_time = start_time + timedelta(hours=duration_hours)
-        
-        # Validate event times
-        if not validate_event_times(start_time, end_time):
-            print(f"⚠️ Invalid event times generated for {event_titles[i]}. Regenerating...")
-            # Adjust end_time to ensure it's valid
-            end_time = start_time + timedelta(hours=8)
-        
-        print(f"Future event duration: {duration_hours} hours")
-        
-        # Generate a venue within 15km of base location
-        lat, lng = generate_location_near_base()
-        
-        # Create a schedule with 3-5 items distributed throughout the event
-        schedule_items = []
-        num_items = random.randint(3, 5)
-        
-        # Divide the event duration into roughly equal segments
-        segment_duration = duration_hours / num_items
-        
-        for j in range(num_items):
-            # Calculate segment boundaries
-            segment_start = start_time + timedelta(hours=j * segment_duration)
-            segment_end = start_time + timedelta(hours=(j + 1) * segment_duration)
-            
-            # Add some randomness within the segment
-            buffer = min(60, segment_duration * 60 * 0.2)  # 20% of segment as buffer in minutes
-            item_start = segment_start + timedelta(minutes=random.randint(0, int(buffer)))
-            
-            # Duration between 45-90 minutes, but ensure it ends before segment end
-            max_duration = max(45, min(90, (segment_end - item_start).total_seconds() / 60 - 10))
-            item_duration = random.randint(45, int(max_duration))
-            item_end = item_start + timedelta(minutes=item_duration)
-            
-            # Validate schedule item times
-            if not validate_schedule_item_times(item_start, item_end, start_time, end_time):
-                print(f"⚠️ Invalid schedule item times. Adjusting...")
-                # Ensure item is within event boundaries
-                if item_start < start_time:
-                    item_start = start_time + timedelta(minutes=random.randint(10, 30))
-                if item_end > end_time:
-                    item_end = end_time - timedelta(minutes=random.randint(10, 30))
-                # Ensure item start is before end
-                if item_start >= item_end:
-                    item_end = item_start + timedelta(minutes=45)
-                # Final check
-                if not validate_schedule_item_times(item_start, item_end, start_time, end_time):
-                    print(f"⚠️ Could not create valid schedule item. Skipping...")
-                    continue
-            
-            print(f"  Schedule item {j+1}: {item_start.strftime('%H:%M')} - {item_end.strftime('%H:%M')}")
-            
-            schedule_items.append({
-                "title": f"Session {j+1}: {random.choice(['Workshop', 'Talk', 'Panel', 'Networking'])}",
-                "speaker_name": f"{random.choice(first_names)} {random.choice(last_names)}",
-                "description": "Session description goes here.",
-                "start_time": item_start.isoformat(),
-                "end_time": item_end.isoformat()
-            })
-        
-        # Generate a different organizer email for remaining events
-        organizer_first_name = random.choice(first_names).lower()
-        organizer_email = f"{organizer_first_name}.organizer@eventmesh.com"
-        
-        # Create the event data
-        event_data = {
-            "title": event_titles[i],
-            "description": event_descriptions[i],
-            "start_time": start_time.isoformat(),
-            "end_time": end_time.isoformat(),
-            "venue": {
-                "name": f"Venue {i+1}",
-                "address": f"{random.randint(100, 999)} Main St, Goa, India",
-                "latitude": lat,
-                "longitude": lng
-            },
-            "category": event_categories[i],
-            "image_url": f"https://picsum.photos/800/600?random={i}",
-            "price": random.choice([0, 0, 10.99, 25.50, 49.99]),
-            "organizer_name": f"{random.choice(first_names)} {random.choice(last_names)}",
-            "organizer_email": organizer_email,  # Different organizer email for remaining events
-            "organizer_phone": f"555-{random.randint(100, 999)}-{random.randint(1000, 9999)}",
-            "schedule": schedule_items
-        }
-        
-        print(f"Creating future event {i-6}/{count-7}: {event_data['title']}")
-        print(f"Event time: {start_time.strftime('%Y-%m-%d %H:%M')} to {end_time.strftime('%Y-%m-%d %H:%M')}")
-        print(f"Event location: {lat:.6f}, {lng:.6f}")
-        
-        # Create event
-        response = requests.post(f"{API_BASE_URL}/events", json=event_data)
-        created_event = print_response(response, f"Created event {event_data['title']}")
-        
+    # First 7 events will be in the past, the rest in the future
+    events_data = [
+        _build_event(i, "past" if i < 7 else "future", now, locations[i], RNG)
+        for i in range(count)
+    ]
+    
+    # Create events concurrently (results come back in input order)
+    created_events = asyncio.run(post_many_async([
+        (f"{API_BASE_URL}/events", event_data, f"Created event {event_data['title']}")
+        for event_data in events_data
+    ]))
+    
+    for event_data, created_event in zip(events_data, created_events):
         if created_event:
-            print(f"Waiting 10 seconds to verify event creation...")
-            time.sleep(10)
-            
-            # Verify event exists by fetching details
-            print(f"Verifying event {created_event['id']} exists...")
-            verify_response = requests.get(f"{API_BASE_URL}/events/{created_event['id']}")
+            # Verify event exists by polling its details until it shows up
+            log.info("Verifying event %s exists...", created_event['id'])
+            verify_response = _wait_for_event(created_event['id'], SESSION)
             verified_event = print_response(verify_response, f"Verified event {event_data['title']}")
             
             if verified_event:
@@ -469,156 +487,147 @@ def create_events(count=15, users=None):
     
     # Add 40-80 attendees for each event
     if users and events:
-        for event in events:
-            attendee_count = random.randint(40, 80)
-            attendee_count = min(attendee_count, len(users))
-            print(f"Adding {attendee_count} attendees to event {event['title']}...")
-            
-            # Select random users to attend this event
-            attending_users = random.sample(users, attendee_count)
-            
-            for user in attending_users:
-                print(f"Adding RSVP for {user['display_name']} to {event['title']}")
+        with ThreadPoolExecutor(max_workers=RSVP_WORKERS) as executor:
+            for event in events:
+                attendee_count = random.randint(40, 80)
+                attendee_count = min(attendee_count, len(users))
+                log.info("Adding %s attendees to event %s...", attendee_count, event['title'])
                 
-                # Simple RSVP payload
-                rsvp_data = {
-                    "status": "attending"
-                }
+                # Select random users to attend this event
+                attending_users = sample_users(users, attendee_count)
                 
-                try:
-                    # Make RSVP request
-                    rsvp_url = f"{API_BASE_URL}/events/{event['id']}/rsvp?user_id={user['uid']}"
-                    rsvp_response = requests.post(rsvp_url, json=rsvp_data)
-                    print_response(rsvp_response, f"Added RSVP for {user['display_name']}")
-                except Exception as e:
-                    print(f"❌ Exception while making RSVP request: {str(e)}")
-    
-    print(f"Created {len(events)} events successfully")
+                # RSVPs are independent, so send them concurrently
+                futures = {}
+                for user in attending_users:
+                    log.debug("Adding RSVP for %s to %s", user['display_name'], event['title'])
+                    futures[executor.submit(_post_rsvp, SESSION, event, user)] = user
+                
+                for future in as_completed(futures):
+                    user = futures[future]
+                    try:
+                        print_response(future.result(), f"Added RSVP for {user['display_name']}")
+                    except Exception as e:
+                        log.error("❌ Exception while making RSVP request: %s", e)
+    
+    log.info("Created %d events successfully", len(events))
     return events
 
 def create_connections(users):
     """Create connections between users with mutual interests"""
-    print(f"\n{'=' * 50}\nGENERATING CONNECTIONS\n{'=' * 50}")
+    log.info("\n%s\nGENERATING CONNECTIONS\n%s", _RULE, _RULE)
     
-    connection_count = 0
+    planned = []
+    
+    # Index users by interest so mutual-interest lookups don't scan every pair
+    users_by_uid = {user['uid']: user for user in users}
+    by_interest = defaultdict(set)
+    for user in users:
+        for interest in user['interest_set']:
+            by_interest[interest].add(user['uid'])
     
     # Each user will send 5-10 connection requests (or as many as possible with mutual interests)
     for user in users:
-        # Find all users with at least two mutual interests
-        potential_connections = []
-        for other_user in users:
-            if other_user['uid'] != user['uid'] and check_mutual_interests(user['interests'], other_user['interests']):
-                potential_connections.append(other_user)
+        # Find all users with at least two mutual interests by counting shared index hits
+        counts = Counter()
+        for interest in user['interest_set']:
+            counts.update(by_interest[interest])
+        del counts[user['uid']]
+        potential_connections = [users_by_uid[uid] for uid, shared in counts.items() if shared >= 2]
         
         if not potential_connections:
-            print(f"⚠️ No users with 2+ mutual interests found for {user['display_name']}")
+            log.warning("⚠️ No users with 2+ mutual interests found for %s", user['display_name'])
             continue
         
         # Select 5-10 random users to connect with (or fewer if not enough with mutual interests)
         request_count = min(random.randint(5, 10), len(potential_connections))
-        to_connect = random.sample(potential_connections, request_count)
+        to_connect = sample_users(potential_connections, request_count)
+        accepts = (RNG.random(size=request_count) < 0.8).tolist()
         
-        for other_user in to_connect:
-            mutual = set(user['interests']) & set(other_user['interests'])
-            print(f"Creating connection request: {user['display_name']} -> {other_user['display_name']}")
-            print(f"  Mutual interests ({len(mutual)}): {', '.join(mutual)}")
-            
-            connection_data = {
-                "from_user_id": user['uid'],
-                "to_user_id": other_user['uid']
-            }
+        for other_user, accept in zip(to_connect, accepts):
+            # The index already counted shared interests; only chosen pairs materialize them
+            mutual = user['interest_set'] & other_user['interest_set']
+            log.info("Creating connection request: %s -> %s", user['display_name'], other_user['display_name'])
+            log.info("  Mutual interests (%s): %s", counts[other_user['uid']], ', '.join(mutual))
             
-            response = requests.post(f"{API_BASE_URL}/connections/request", json=connection_data)
-            connection_result = print_response(
-                response, 
-                f"Created connection request from {user['display_name']} to {other_user['display_name']}"
-            )
-            
-            if connection_result:
-                # 80% chance to accept the connection
-                if random.random() < 0.8:
-                    # Accept the connection
-                    print(f"{other_user['display_name']} is accepting connection from {user['display_name']}")
-                    
-                    accept_data = {
-                        "request_id": user['uid'],
-                        "user_id": other_user['uid'],
-                        "status": "accept"
-                    }
-                    
-                    accept_response = requests.post(
-                        f"{API_BASE_URL}/connections/respond/find", 
-                        json=accept_data
-                    )
-                    print_response(
-                        accept_response, 
-                        f"{other_user['display_name']} accepted connection from {user['display_name']}"
-                    )
-                connection_count += 1
-    
-    print(f"Created {connection_count} connections")
+            # 80% chance to accept the connection (decided up front)
+            planned.append((user, other_user, accept))
+    
+    # All requests are independent, so send them concurrently first
+    results = asyncio.run(post_many_async([
+        (
+            f"{API_BASE_URL}/connections/request",
+            {"from_user_id": user['uid'], "to_user_id": other_user['uid']},
+            f"Created connection request from {user['display_name']} to {other_user['display_name']}"
+        )
+        for user, other_user, _ in planned
+    ]))
+    connection_count = sum(1 for result in results if result)
+    
+    # Then accept the created requests that were picked for acceptance
+    accepted = [
+        (user, other_user)
+        for (user, other_user, accept), result in zip(planned, results)
+        if result and accept
+    ]
+    for user, other_user in accepted:
+        log.info("%s is accepting connection from %s", other_user['display_name'], user['display_name'])
+    asyncio.run(post_many_async([
+        (
+            f"{API_BASE_URL}/connections/respond/find",
+            orjson.dumps({"request_id": user['uid'], "user_id": other_user['uid'], "status": "accept"}),
+            f"{other_user['display_name']} accepted connection from {user['display_name']}"
+        )
+        for user, other_user in accepted
+    ]))
+    
+    log.info("Created %d connections", connection_count)
 
 def create_feedback(users, events):
     """Create feedback for events"""
-    print(f"\n{'=' * 50}\nGENERATING EVENT FEEDBACK\n{'=' * 50}")
+    log.info("\n%s\nGENERATING EVENT FEEDBACK\n%s", _RULE, _RULE)
     
-    feedback_count = 0
+    submissions = []
     
     for event in events:
         # Get 15-25 random users to provide feedback
-        feedback_users = random.sample(users, min(random.randint(15, 25), len(users)))
+        feedback_users = sample_users(users, min(random.randint(15, 25), len(users)))
         
-        for user in feedback_users:
-            print(f"Creating feedback from {user['display_name']} for {event['title']}")
-            
-            # 70% positive, 30% negative feedback
-            if random.random() < 0.7:
-                # Positive feedback (3-5 stars)
-                rating = random.randint(3, 5)
-                comment = random.choice([
-                    "Really enjoyed this event!",
-                    "Great organization and content.",
-                    "Would definitely attend again.",
-                    "Excellent speakers and venue.",
-                    "Learned a lot from this event."
-                ])
-            else:
-                # Negative feedback (1-2 stars)
-                rating = random.randint(1, 2)
-                comment = random.choice([
-                    "Poor organization, would not recommend.",
-                    "The content was disappointing.",
-                    "Too crowded and poorly managed.",
-                    "Speakers were not prepared well.",
-                    "Not worth the price of admission.",
-                    "Schedule was not followed properly."
-                ])
-            
-            feedback_data = {
-                "rating": rating,
-                "comment": comment
-            }
-            
-            response = requests.post(
-                f"{API_BASE_URL}/feedback/{event['id']}?user_id={user['uid']}", 
-                json=feedback_data
-            )
-            
-            if print_response(response, f"Created feedback from {user['display_name']} for {event['title']}"):
-                feedback_count += 1
+        # Draw every rating and comment for this event in one batch each
+        n = len(feedback_users)
+        is_pos = RNG.random(n) < 0.7  # 70% positive, 30% negative feedback
+        # Positive feedback is 3-5 stars, negative feedback 1-2 stars
+        ratings = np.where(is_pos, RNG.integers(3, 6, n), RNG.integers(1, 3, n)).tolist()
+        pos_idx = RNG.integers(0, len(POS_COMMENTS), n).tolist()
+        neg_idx = RNG.integers(0, len(NEG_COMMENTS), n).tolist()
+        comments = [
+            POS_COMMENTS[pi] if p else NEG_COMMENTS[ni]
+            for p, pi, ni in zip(is_pos.tolist(), pos_idx, neg_idx)
+        ]
+        
+        for user, rating, comment in zip(feedback_users, ratings, comments):
+            log.info("Creating feedback from %s for %s", user['display_name'], event['title'])
+            submissions.append((
+                f"{API_BASE_URL}/feedback/{event['id']}?user_id={user['uid']}",
+                {"rating": rating, "comment": comment},
+                f"Created feedback from {user['display_name']} for {event['title']}"
+            ))
+    
+    # Submissions are independent, so send them concurrently
+    results = asyncio.run(post_many_async(submissions))
+    feedback_count = sum(1 for result in results if result)
     
-    print(f"Created {feedback_count} feedback entries")
+    log.info("Created %d feedback entries", feedback_count)
 
 def main():
-    print(f"\n{'=' * 50}\nEVENTMESH MOCK DATA GENERATION SCRIPT\n{'=' * 50}")
-    print("This script will generate additional sample data for the EventMesh application")
-    print(f"All locations will be within 15km of: {BASE_LATITUDE}, {BASE_LONGITUDE} (Goa, India)")
+    log.info("\n%s\nEVENTMESH MOCK DATA GENERATION SCRIPT\n%s", _RULE, _RULE)
+    log.info("This script will generate additional sample data for the EventMesh application")
+    log.info("All locations will be within 15km of: %s, %s (Goa, India)", BASE_LATITUDE, BASE_LONGITUDE)
     
     # Create users
-    users = create_users(150)
+    users = asyncio.run(create_users_async(150))
     
     if not users:
-        print("Failed to create users. Exiting.")
+        log.error("Failed to create users. Exiting.")
         return
     
     # Create events (7 past events + 8 future events)
@@ -631,12 +640,13 @@ def main():
     if events:
         create_feedback(users, events)
     
-    print(f"\n{'=' * 50}\nMOCK DATA GENERATION COMPLETE\n{'=' * 50}")
-    print(f"Generated {len(users)} users")
-    print(f"Generated {len(events)} events")
-    print("Run the admin migration endpoints to ensure data consistency:")
-    print(f"POST {API_BASE_URL}/admin/recalculate-counts")
-    print(f"POST {API_BASE_URL}/admin/update-connections-arrays")
+    log.info("\n%s\nMOCK DATA GENERATION COMPLETE\n%s", _RULE, _RULE)
+    log.info("Generated %d users", len(users))
+    log.info("Generated %d events", len(events))
+    log.info("Run the admin migration endpoints to ensure data consistency:")
+    log.info("POST %s/admin/recalculate-counts", API_BASE_URL)
+    log.info("POST %s/admin/update-connections-arrays", API_BASE_URL)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     main()
\ No newline at end of file
@@ -1,44 +1,89 @@
+import asyncio
+import heapq
+import logging
+from operator import itemgetter
 from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import Response, StreamingResponse
 from typing import List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
-from app.models.connection import ConnectionRequest, ConnectionResponse, ConnectionSuggestion, ConnectionRecommendation
+from app.models.connection import ConnectionRequest, ConnectionBulkRequest, ConnectionResponse, ConnectionBulkResponse, ConnectionSuggestion, ConnectionRecommendation
 from app.services.firebase_service import firebase_service
 from app.services.recommendation_service import recommendation_service
+from app.services.cache_service import cache_service, conn_tag, feed_tag, to_json
 from app.utils.validators import validate_connection_status
-from app.models.connection import ConnectionRecommendation
-from app.services.recommendation_service import recommendation_service
-
+from app.utils.time_utils import to_utc
 
 router = APIRouter()
+log = logging.getLogger(__name__)
 
-# Update the request endpoint
-@router.post("/request")
-async def create_connection_request(request: ConnectionRequest):
-    """Send a connection request to another user"""
+# Seconds that cached connection lists and recommendations stay valid
+CONNECTIONS_CACHE_TTL = 30
+RECOMMENDATIONS_CACHE_TTL = 60
+
+# Seconds a built feed stays cached (writes that change it invalidate it sooner)
+FEED_CACHE_TTL = 300
+
+# Values a connection response may carry
+RESPONSE_STATUSES = frozenset(("accept", "decline"))
+
+# Field masks for the documents the connection endpoints read; the rest of each document is never sent
+PROFILE_FIELDS = ["uid", "display_name", "email", "profile_image_url", "bio"]
+FEED_EVENT_FIELDS = ["id", "title", "start_time", "attendees"]
+
+# Connections enriched per batched user read when streaming a connection list
+ENRICH_CHUNK_SIZE = 20
+
+# Sorts feed items with missing or unparseable timestamps last
+_EPOCH = datetime.min.replace(tzinfo=timezone.utc)
+
+def _feed_sort_ts(value) -> datetime:
+    """Normalize a timestamp to an aware UTC datetime, with missing or unparseable values as _EPOCH"""
+    return to_utc(value) or _EPOCH
+
+def _look_back_date(days: int) -> datetime:
+    """Start of a look-back window, as an aware UTC datetime comparable with Firestore Timestamps"""
+    return datetime.now(timezone.utc) - timedelta(days=days)
+
+async def _invalidate_connection_caches(*user_ids: str):
+    """Drop cached connection lists, feeds and recommendations for users whose connections just changed"""
+    await cache_service.invalidate_tags(*(conn_tag(user_id) for user_id in set(user_ids)))
+
+def _connection_exists(conn: dict):
+    """Response for a connection request whose user pair already has a connection"""
+    return {
+        "status": "exists",
+        "message": "Connection already exists or is pending",
+        "connection_id": conn["id"],
+        "connection_status": conn["status"]
+    }
+
+async def _create_connection_request(request: ConnectionRequest):
+    """Create a single connection request, raising HTTPException on failure"""
+    # Both users and any existing connection are independent reads, so fetch them together
+    from_user, to_user, conn = await asyncio.gather(
+        firebase_service.get_user(request.from_user_id),
+        firebase_service.get_user(request.to_user_id),
+        firebase_service.get_connection_by_pair(request.from_user_id, request.to_user_id)
+    )
+    
     # Check if users exist
-    from_user = await firebase_service.get_user(request.from_user_id)
     if not from_user:
         raise HTTPException(status_code=404, detail="Requesting user not found")
     
-    to_user = await firebase_service.get_user(request.to_user_id)
     if not to_user:
         raise HTTPException(status_code=404, detail="Target user not found")
     
-    # Check if request already exists
-    existing_connections = await firebase_service.get_user_connections(request.from_user_id)
-    for conn in existing_connections:
-        if (conn["from_user_id"] == request.from_user_id and conn["to_user_id"] == request.to_user_id) or \
-           (conn["from_user_id"] == request.to_user_id and conn["to_user_id"] == request.from_user_id):
-            return {
-                "status": "exists",
-                "message": "Connection already exists or is pending",
-                "connection_id": conn["id"],
-                "connection_status": conn["status"]
-            }
+    # Check if request already exists (in either direction)
+    if conn:
+        return _connection_exists(conn)
     
-    # Create connection request
+    # Create connection request; the pair may have been created since the read above
     connection = await firebase_service.create_connection_request(request.from_user_id, request.to_user_id)
+    if connection is None:
+        conn = await firebase_service.get_connection_by_pair(request.from_user_id, request.to_user_id)
+        return _connection_exists(conn)
+    await _invalidate_connection_caches(request.from_user_id, request.to_user_id)
     
     return {
         "status": "success",
@@ -46,26 +91,37 @@ async def create_connection_request(request: ConnectionRequest):
         "connection_id": connection["id"]
     }
 
-# Modify the respond endpoint
-@router.post("/respond/{connection_id}")
-async def respond_to_connection_request(
-    connection_id: str, 
-    response: ConnectionResponse
-):
-    """Accept or decline a connection request"""
+# Update the request endpoint
+@router.post("/request")
+async def create_connection_request(request: ConnectionRequest):
+    """Send a connection request to another user"""
+    return await _create_connection_request(request)
+
+@router.post("/request/bulk")
+async def create_connection_requests_bulk(payload: ConnectionBulkRequest):
+    """
+    Send several connection requests in one request.
+    
+    Returns one result per input request, in input order. Each result carries
+    its own status_code so a failure on one request doesn't fail the batch.
+    """
+    results = []
+    for request in payload.requests:
+        try:
+            result = await _create_connection_request(request)
+            results.append({"status_code": 200, "result": result})
+        except HTTPException as e:
+            results.append({"status_code": e.status_code, "detail": e.detail})
+    return {"results": results}
+
+async def _respond_to_connection(response: ConnectionResponse):
+    """Accept or decline a single connection request, raising HTTPException on failure"""
     # Validate response
-    if response.status not in ["accept", "decline"]:
+    if response.status not in RESPONSE_STATUSES:
         raise HTTPException(status_code=400, detail="Invalid response status")
     
-    # Get existing connections for the responding user
-    existing_connections = await firebase_service.get_user_connections(response.user_id)
-    
     # Find the connection between the sender and receiver
-    connection = next((
-        conn for conn in existing_connections 
-        if (conn["to_user_id"] == response.user_id and conn["from_user_id"] == response.request_id) or
-            (conn["from_user_id"] == response.user_id and conn["to_user_id"] == response.request_id)
-    ), None)
+    connection = await firebase_service.get_connection_by_pair(response.user_id, response.request_id)
     
     if not connection:
         raise HTTPException(status_code=404, detail="Connection request not found")
@@ -74,61 +130,32 @@ async def respond_to_connection_request(
     if connection["to_user_id"] != response.user_id:
         raise HTTPException(status_code=403, detail="Only the recipient can respond to this request")
     
-    # Map response to connection status
-    status_map = {
-        "accept": "accepted",
-        "decline": "declined"
-    }
-    
     try:
         # Get the actual connection_id from the found connection document
         actual_connection_id = connection["id"]
         
         if response.status == "accept":
-            # Update connection status
-            updated_connection = await firebase_service.update_connection_status(actual_connection_id, status_map[response.status])
+            from_user_id = connection["from_user_id"]
+            to_user_id = connection["to_user_id"]
             
-            from_user_id = updated_connection["from_user_id"]
-            to_user_id = updated_connection["to_user_id"]
-            
-            # Ensure both users exist and get their current connection counts
-            from_user = await firebase_service.get_user(from_user_id)
-            to_user = await firebase_service.get_user(to_user_id)
-            
-            if from_user and to_user:
-                # Update connection counts
-                from_count = from_user.get("connection_count", 0) + 1
-                to_count = to_user.get("connection_count", 0) + 1
-                
-                # Add connections array if it doesn't exist
-                from_connections = from_user.get("connections", [])
-                to_connections = to_user.get("connections", [])
-                
-                # Add user IDs to the connections array if not already there
-                if to_user_id not in from_connections:
-                    from_connections.append(to_user_id)
-                
-                if from_user_id not in to_connections:
-                    to_connections.append(from_user_id)
-                
-                # Update both users with connection count and connections array
-                await firebase_service.update_user(from_user_id, {
-                    "connection_count": from_count,
-                    "connections": from_connections
-                })
-                
-                await firebase_service.update_user(to_user_id, {
-                    "connection_count": to_count,
-                    "connections": to_connections
-                })
-                
-                print(f"Updated connections arrays - From: {from_user_id} ({from_connections}), To: {to_user_id} ({to_connections})")
+            # Update connection status, counts and connections arrays together
+            await firebase_service.accept_connection(
+                actual_connection_id, from_user_id, to_user_id,
+                was_pending=connection["status"] == "pending"
+            )
+            log.debug("accepted connection %s from=%s to=%s", actual_connection_id, from_user_id, to_user_id)
             
         else:  # Decline request
             # Delete the connection document instead of updating status
-            connection_ref = firebase_service.db.collection('connections').document(actual_connection_id)
-            connection_ref.delete()
-            print(f"Deleted connection request {actual_connection_id}")
+            await firebase_service.delete_connection(
+                actual_connection_id,
+                pending_to_user_id=connection["to_user_id"] if connection["status"] == "pending" else None
+            )
+            log.debug("declined connection %s", actual_connection_id)
+        
+        # In-process results first, so a concurrent request can't refill the shared cache from them
+        recommendation_service.invalidate_user(connection["from_user_id"], connection["to_user_id"])
+        await _invalidate_connection_caches(connection["from_user_id"], connection["to_user_id"])
         
         return {
             "status": "success",
@@ -138,6 +165,33 @@ async def respond_to_connection_request(
     except Exception as e:
         raise HTTPException(status_code=404, detail=f"Connection request not found: {str(e)}")
 
+# Registered before /respond/{connection_id} so "bulk" isn't taken as a connection ID
+@router.post("/respond/bulk")
+async def respond_to_connection_requests_bulk(payload: ConnectionBulkResponse):
+    """
+    Accept or decline several connection requests in one request.
+    
+    Returns one result per input response, in input order. Each result carries
+    its own status_code so a failure on one request doesn't fail the batch.
+    """
+    results = []
+    for response in payload.responses:
+        try:
+            result = await _respond_to_connection(response)
+            results.append({"status_code": 200, "result": result})
+        except HTTPException as e:
+            results.append({"status_code": e.status_code, "detail": e.detail})
+    return {"results": results}
+
+# Modify the respond endpoint
+@router.post("/respond/{connection_id}")
+async def respond_to_connection_request(
+    connection_id: str, 
+    response: ConnectionResponse
+):
+    """Accept or decline a connection request"""
+    return await _respond_to_connection(response)
+
 @router.get("/user/{user_id}")
 async def get_user_connections(
     user_id: str,
@@ -153,18 +207,47 @@ async def get_user_connections(
     if status and not validate_connection_status(status):
         raise HTTPException(status_code=400, detail="Invalid connection status")
     
+    cache_key = f"conn:{user_id}:{status or 'all'}"
+    # Cached lists are already JSON; send the bytes as they are
+    cached = await cache_service.get_raw(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+    
+    async def stream_connections():
+        # Emit a JSON array item by item, then cache the same bytes (each item is encoded once)
+        parts = [b"["]
+        yield b"["
+        async for enriched_conn in _enrich_user_connections(user_id, status):
+            part = (b"," if len(parts) > 1 else b"") + to_json(enriched_conn)
+            parts.append(part)
+            yield part
+        parts.append(b"]")
+        yield b"]"
+        await cache_service.set_raw(cache_key, b"".join(parts), CONNECTIONS_CACHE_TTL, (conn_tag(user_id),))
+    
+    return StreamingResponse(stream_connections(), media_type="application/json")
+
+async def _enrich_user_connections(user_id: str, status: Optional[str]):
+    """Yield a user's connections with the other user's profile details, chunk by chunk"""
     # Get connections
     connections = await firebase_service.get_user_connections(user_id, status)
     
-    # Enrich with user details
-    enriched_connections = []
-    for conn in connections:
-        # Determine the other user in the connection
-        other_user_id = conn["to_user_id"] if conn["from_user_id"] == user_id else conn["from_user_id"]
-        other_user = await firebase_service.get_user(other_user_id)
+    for start in range(0, len(connections), ENRICH_CHUNK_SIZE):
+        chunk = connections[start:start + ENRICH_CHUNK_SIZE]
         
-        if other_user:
-            enriched_conn = {
+        # Determine the other user in each connection and read the chunk in one batch
+        other_user_ids = [
+            conn["to_user_id"] if conn["from_user_id"] == user_id else conn["from_user_id"]
+            for conn in chunk
+        ]
+        other_users = await firebase_service.get_users_bulk(other_user_ids, fields=PROFILE_FIELDS)
+        
+        # Enrich with user details
+        for conn, other_user_id in zip(chunk, other_user_ids):
+            other_user = other_users.get(other_user_id)
+            if not other_user:
+                continue
+            yield {
                 "connection_id": conn["id"],
                 "status": conn["status"],
                 "created_at": conn["created_at"],
@@ -177,9 +260,6 @@ async def get_user_connections(
                     "bio": other_user.get("bio")
                 }
             }
-            enriched_connections.append(enriched_conn)
-    
-    return enriched_connections
 
 
 
@@ -196,21 +276,33 @@ async def get_pending_connection_requests(user_id: str = Query(..., description=
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    # Get all connections for the user
-    all_connections = await firebase_service.get_user_connections(user_id)
+    # The counter is maintained on request/accept/decline; users without it take the full path
+    if user.get("pending_incoming_count") == 0:
+        return []
     
-    # Filter for incoming requests that are pending
-    pending_requests = [
-        conn for conn in all_connections 
-        if conn["to_user_id"] == user_id and conn["status"] == "pending"
-    ]
+    return await cache_service.get_or_set(
+        f"conn:{user_id}:pending-senders",
+        lambda: _pending_senders(user_id),
+        CONNECTIONS_CACHE_TTL,
+        (conn_tag(user_id),)
+    )
+
+async def _pending_senders(user_id: str):
+    """Build the list of users with pending connection requests to user_id"""
+    # Only pending connections are read (the status filter is served by the participants index)
+    pending_connections = await firebase_service.get_user_connections(user_id, status="pending")
+    
+    # Filter for incoming requests
+    pending_requests = [conn for conn in pending_connections if conn["to_user_id"] == user_id]
+    
+    # Get sender details for every pending request in one batch
+    senders = await firebase_service.get_users_bulk(
+        [request["from_user_id"] for request in pending_requests], fields=PROFILE_FIELDS
+    )
     
-    # Get sender details for each pending request
     pending_senders = []
     for request in pending_requests:
-        sender_id = request["from_user_id"]
-        sender = await firebase_service.get_user(sender_id)
-        
+        sender = senders.get(request["from_user_id"])
         if sender:
             pending_senders.append({
                 "connection_id": request["id"],
@@ -244,9 +336,12 @@ async def get_connection_recommendations(
         raise HTTPException(status_code=404, detail="User not found")
     
     # Get recommendations from the recommendation service
-    recommendations = await recommendation_service.get_connection_recommendations(
-        user_id=user_id,
-        limit=limit
+    # Tagged with the user's connections so connection changes invalidate them too
+    recommendations = await cache_service.get_or_set(
+        f"conn:{user_id}:recs:{limit}",
+        lambda: recommendation_service.get_connection_recommendations(user_id=user_id, limit=limit),
+        RECOMMENDATIONS_CACHE_TTL,
+        (conn_tag(user_id),)
     )
     
     # The recommendations already include score from your recommendation service
@@ -267,13 +362,14 @@ async def get_event_based_connection_recommendations(
     
     Returns connections with a score indicating relevance.
     """
-    # Validate user exists
-    user = await firebase_service.get_user(user_id)
+    # Validate user and event exist (both lookups are independent)
+    user, event = await asyncio.gather(
+        firebase_service.get_user(user_id),
+        firebase_service.get_event(event_id)
+    )
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    # Validate event exists
-    event = await firebase_service.get_event(event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
     
@@ -306,60 +402,50 @@ async def get_connections_activity(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    # Get user's connections
-    connections = await firebase_service.get_user_connections(user_id, status="accepted")
-    connection_ids = [conn["from_user_id"] if conn["to_user_id"] == user_id else conn["to_user_id"] 
-                      for conn in connections]
+    # Accepted connections are mirrored on the user document, which we already have
+    connection_ids = frozenset(user.get("connections", ()))
     
     if not connection_ids:
         return []
     
-    # Get recent events (within specified days)
-    look_back_date = datetime.now() - timedelta(days=days)
-    events = await firebase_service.get_events(
-        {"start_date": look_back_date},
-        limit=100
+    # Get recent events (within specified days) that at least one connection is attending
+    look_back_date = _look_back_date(days)
+    events = await firebase_service.get_events_attended_by(
+        connection_ids, look_back_date, limit=100, fields=FEED_EVENT_FIELDS
     )
     
     # Activity feed to return
     activity_feed = []
     
-    # For each event, get attendees that are connections of the user
+    # One pass over every event's attendees keeps the in-window RSVPs by connections
+    # and collects whose profiles are needed
+    attendees_by_event = []
+    attending_ids = set()
     for event in events:
+        connection_attendees = []
+        # The event documents already carry their attendees; don't read them again
+        for attendee in event.get("attendees", []):
+            if attendee.get("user_id") not in connection_ids:
+                continue
+            # Legacy string dates from before migrate_data_structures still count; missing ones sort as epoch
+            rsvp_date = _feed_sort_ts(attendee.get("rsvp_date"))
+            # Skip RSVPs older than the look-back period
+            if rsvp_date >= look_back_date:
+                connection_attendees.append((attendee, rsvp_date))
+                attending_ids.add(attendee["user_id"])
+        attendees_by_event.append((event, connection_attendees))
+    
+    # Read every attending connection's profile in one batched lookup
+    connection_users = await firebase_service.get_users_bulk(list(attending_ids), fields=PROFILE_FIELDS)
+    
+    for event, connection_attendees in attendees_by_event:
         event_id = event.get("id")
-        event_attendees = await firebase_service.get_event_attendees(event_id)
-        
-        # Filter to only include connections
-        connection_attendees = [
-            attendee for attendee in event_attendees
-            if attendee.get("user_id") in connection_ids
-        ]
         
         # Get connection details and create activity objects
-        for attendee in connection_attendees:
-            connection_id = attendee.get("user_id")
-            connection = await firebase_service.get_user(connection_id)
+        for attendee, rsvp_date in connection_attendees:
+            connection = connection_users.get(attendee["user_id"])
             
             if connection:
-                # Get and parse RSVP date
-                rsvp_date = attendee.get("rsvp_date")
-                
-                # Skip if no RSVP date
-                if not rsvp_date:
-                    continue
-                
-                # Convert string dates to datetime objects if needed
-                if isinstance(rsvp_date, str):
-                    try:
-                        rsvp_date = datetime.fromisoformat(rsvp_date.replace('Z', '+00:00'))
-                        rsvp_date = rsvp_date.replace(tzinfo=None)  # Make naive
-                    except ValueError:
-                        continue
-                
-                # Skip if RSVP is older than the look-back period
-                if rsvp_date < look_back_date:
-                    continue
-                
                 # Simplified activity object with only the requested fields
                 activity = {
                     "user": {
@@ -377,15 +463,14 @@ async def get_connections_activity(
                 
                 activity_feed.append(activity)
     
-    # Sort by timestamp (most recent first)
-    activity_feed.sort(key=lambda x: x.get("timestamp", datetime.min), reverse=True)
+    # Keep only the most recent activities; a bounded heap avoids sorting the whole feed
+    activity_feed = heapq.nlargest(limit, activity_feed, key=itemgetter("timestamp"))
     
     # Remove timestamp from the final response objects
     for activity in activity_feed:
         activity.pop("timestamp", None)
     
-    # Return limited number of activities
-    return activity_feed[:limit]
+    return activity_feed
 
 @router.get("/feed/{user_id}")
 async def get_user_feed(
@@ -401,27 +486,38 @@ async def get_user_feed(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
+    # The built feed is kept in the cache; RSVPs and connection changes invalidate it on write
+    cache_key = f"conn:{user_id}:feed:{limit}:{days}"
+    cached = await cache_service.get_raw(cache_key)
+    if cached is None:
+        # Encode once and send the same bytes that are cached
+        cached = to_json(await _build_user_feed(user, user_id, limit, days))
+        await cache_service.set_raw(cache_key, cached, FEED_CACHE_TTL, (conn_tag(user_id), feed_tag(user_id)))
+    return Response(content=cached, media_type="application/json")
+
+async def _build_user_feed(user: dict, user_id: str, limit: int, days: int):
+    """Build the combined feed of pending requests and connection activity for user_id"""
     # Combined feed list
     combined_feed = []
     
     # PART 1: Get pending connection requests
-    all_connections = await firebase_service.get_user_connections(user_id)
-    
-    # Filter for incoming requests that are pending
-    pending_requests = [
-        conn for conn in all_connections 
-        if conn["to_user_id"] == user_id and conn["status"] == "pending"
-    ]
+    # Accepted connections come from the user document below, so only pending ones are queried,
+    # and not even those when the user's pending counter says there are none
+    pending_requests = []
+    if user.get("pending_incoming_count") != 0:
+        pending_connections = await firebase_service.get_user_connections(user_id, status="pending")
+        pending_requests = [conn for conn in pending_connections if conn["to_user_id"] == user_id]
     
     # Add pending requests to combined feed
+    senders = await firebase_service.get_users_bulk(
+        [request["from_user_id"] for request in pending_requests], fields=PROFILE_FIELDS
+    )
     for request in pending_requests:
-        sender_id = request["from_user_id"]
-        sender = await firebase_service.get_user(sender_id)
-        
+        sender = senders.get(request["from_user_id"])
         if sender:
             combined_feed.append({
                 "type": "pending_request",
-                "timestamp": request.get("created_at"),  # Keep for sorting
+                "_sort_ts": _feed_sort_ts(request.get("created_at")),  # Keep for sorting
                 "connection_id": request["id"],
                 "user": {
                     "uid": sender.get("uid"),
@@ -432,36 +528,42 @@ async def get_user_feed(
             })
     
     # PART 2: Get connection activities
-    connections = await firebase_service.get_user_connections(user_id, status="accepted")
-    connection_ids = [conn["from_user_id"] if conn["to_user_id"] == user_id else conn["to_user_id"] 
-                     for conn in connections]
+    # Accepted connections are mirrored on the user document, which we already have
+    connection_ids = frozenset(user.get("connections", ()))
     
     if connection_ids:
         # Get recent events - still use the days parameter for filtering events
-        look_back_date = datetime.now() - timedelta(days=days)
-        events = await firebase_service.get_events(
-            {"start_date": look_back_date},
-            limit=100
+        # Only events a connection is attending are returned, via the attendee_ids index
+        look_back_date = _look_back_date(days)
+        events = await firebase_service.get_events_attended_by(
+            connection_ids, look_back_date, limit=100, fields=FEED_EVENT_FIELDS
         )
         
+        # One pass keeps RSVPs by connections and collects whose profiles are needed
+        attendees_by_event = []
+        attending_ids = set()
         for event in events:
+            connection_attendees = []
+            # The event documents already carry their attendees; don't read them again
+            for attendee in event.get("attendees", []):
+                if attendee.get("user_id") in connection_ids and attendee.get("rsvp_date"):
+                    connection_attendees.append(attendee)
+                    attending_ids.add(attendee["user_id"])
+            attendees_by_event.append((event, connection_attendees))
+        
+        # Read every attending connection's profile in one batched lookup
+        connection_users = await firebase_service.get_users_bulk(list(attending_ids), fields=PROFILE_FIELDS)
+        
+        for event, connection_attendees in attendees_by_event:
             event_id = event.get("id")
-            event_attendees = await firebase_service.get_event_attendees(event_id)
-            
-            # Filter to only include connections
-            connection_attendees = [
-                attendee for attendee in event_attendees
-                if attendee.get("user_id") in connection_ids
-            ]
             
             for attendee in connection_attendees:
-                connection_id = attendee.get("user_id")
-                connection = await firebase_service.get_user(connection_id)
+                connection = connection_users.get(attendee["user_id"])
                 
-                if connection and attendee.get("rsvp_date"):
+                if connection:
                     combined_feed.append({
                         "type": "connection_activity",
-                        "timestamp": attendee.get("rsvp_date"),  # Keep for sorting
+                        "_sort_ts": _feed_sort_ts(attendee.get("rsvp_date")),  # Keep for sorting
                         "user": {
                             "uid": connection.get("uid"),
                             "display_name": connection.get("display_name", "Unknown User"),
@@ -474,15 +576,13 @@ async def get_user_feed(
                         }
                     })
     
-    # Sort combined feed - we'll still sort by timestamp
-    # This might still have issues with different datetime formats but is more resilient
-    combined_feed.sort(key=lambda x: str(x.get("timestamp", "")), reverse=True)
+    # Keep the most recent items (every item's key was normalized once when it was added)
+    combined_feed = heapq.nlargest(limit, combined_feed, key=itemgetter("_sort_ts"))
     
     # Remove internal timestamp field used for sorting
     for item in combined_feed:
-        item.pop("timestamp", None)
+        del item["_sort_ts"]
     
-    # Apply overall limit
-    return combined_feed[:limit]
+    return combined_feed
 
 __all__ = ["router"]
\ No newline at end of file
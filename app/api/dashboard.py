@@ -1,10 +1,16 @@
+import asyncio
+from operator import itemgetter
 from fastapi import APIRouter, HTTPException, Query, Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from app.services.firebase_service import firebase_service
+from app.services.cache_service import cache_service
 
 router = APIRouter()
 
+# Seconds a computed organizer dashboard stays cached
+ORGANIZER_DASHBOARD_CACHE_TTL = 30
+
 @router.get("/{event_id}/comprehensive")
 async def get_comprehensive_event_details(
     event_id: str = Path(..., description="ID of the event to get comprehensive details for")
@@ -17,22 +23,31 @@ async def get_comprehensive_event_details(
     
     Returns a single object with all information consolidated.
     """
+    # The event and its feedback are independent reads
+    event, feedback_list = await asyncio.gather(
+        firebase_service.get_event(event_id),
+        firebase_service.get_event_feedback(event_id)
+    )
     # Check if event exists
-    event = await firebase_service.get_event(event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
     
-    # Get attendees
-    attendees = await firebase_service.get_event_attendees(event_id)
+    # The event document already carries its attendees; don't read it again
+    attendees = event.get("attendees", [])
+    
+    # Attendees often left feedback too; read each distinct user once, in one batched lookup
+    users_by_id = await firebase_service.get_users_bulk(
+        [attendee["user_id"] for attendee in attendees]
+        + [feedback["user_id"] for feedback in feedback_list if feedback.get("user_id")]
+    )
     
     # Enrich with user details
     enriched_attendees = []
     for attendee in attendees:
-        user_id = attendee["user_id"]
-        user_details = await firebase_service.get_user(user_id)
+        user_details = users_by_id.get(attendee["user_id"])
         if user_details:
             enriched_attendee = {
-                "user_id": user_id,
+                "user_id": attendee["user_id"],
                 "display_name": user_details.get("display_name", "Unknown"),
                 "profile_image_url": user_details.get("profile_image_url"),
                 "email": user_details.get("email"),
@@ -40,34 +55,26 @@ async def get_comprehensive_event_details(
             }
             enriched_attendees.append(enriched_attendee)
     
-    # Get all feedback
-    feedback_list = await firebase_service.get_event_feedback(event_id)
-    
-    # Enrich feedback with user details
+    # Enrich feedback with user details and calculate feedback stats in the same pass
     enriched_feedback = []
-    for feedback in feedback_list:
-        user_id = feedback.get("user_id")
-        if user_id:
-            user_details = await firebase_service.get_user(user_id)
-            if user_details:
-                enriched_feedback_item = {
-                    **feedback,
-                    "user": {
-                        "user_id": user_id,
-                        "display_name": user_details.get("display_name", "Unknown"),
-                        "profile_image_url": user_details.get("profile_image_url")
-                    }
-                }
-                enriched_feedback.append(enriched_feedback_item)
-    
-    # Calculate feedback stats
     rating_sum = 0
     rating_count = 0
-    
     for feedback in feedback_list:
-        if feedback.get("rating"):
-            rating_sum += feedback["rating"]
+        if rating := feedback.get("rating"):
+            rating_sum += rating
             rating_count += 1
+        
+        user_details = users_by_id.get(feedback.get("user_id"))
+        if user_details:
+            enriched_feedback_item = {
+                **feedback,
+                "user": {
+                    "user_id": feedback["user_id"],
+                    "display_name": user_details.get("display_name", "Unknown"),
+                    "profile_image_url": user_details.get("profile_image_url")
+                }
+            }
+            enriched_feedback.append(enriched_feedback_item)
     
     avg_rating = rating_sum / rating_count if rating_count > 0 else 0
     
@@ -106,14 +113,17 @@ async def get_organizer_dashboard(
     - List of upcoming events sorted by date (nearest first)
     - List of past events sorted by date (most recent first)
     """
-    # Get all events (with a high limit to ensure we get all events)
-    all_events = await firebase_service.get_events(limit=200)
-    
-    # Filter events by organizer email
-    organizer_events = [
-        event for event in all_events 
-        if event.get("organizer_email") == email
-    ]
+    # The aggregate is cached briefly; event, RSVP and feedback writes invalidate it sooner
+    return await cache_service.get_or_set(
+        f"org_dash:{email}",
+        lambda: _build_organizer_dashboard(email),
+        ORGANIZER_DASHBOARD_CACHE_TTL
+    )
+
+async def _build_organizer_dashboard(email: str):
+    """Aggregate the organizer dashboard for email, raising HTTPException if they have no events"""
+    # Get every event by this organizer (the email filter runs in Firestore, with no 200-event ceiling)
+    organizer_events = await firebase_service.get_events_by_organizer(email)
     
     if not organizer_events:
         raise HTTPException(status_code=404, detail="No events found for this organizer")
@@ -133,14 +143,14 @@ async def get_organizer_dashboard(
     total_rating = 0
     total_ratings = 0
     
-    for event in organizer_events:
-        event_id = event.get("id")
-        if event_id:
-            feedback_list = await firebase_service.get_event_feedback(event_id)
-            for feedback in feedback_list:
-                if feedback.get("rating"):
-                    total_rating += feedback["rating"]
-                    total_ratings += 1
+    # All organizer events' feedback comes back from one collection group query (per 30 events)
+    all_feedback = await firebase_service.get_feedback_for_events(
+        [event["id"] for event in organizer_events if event.get("id")]
+    )
+    for feedback in all_feedback:
+        if feedback.get("rating"):
+            total_rating += feedback["rating"]
+            total_ratings += 1
     
     avg_overall_rating = total_rating / total_ratings if total_ratings > 0 else 0
     
@@ -177,7 +187,8 @@ async def get_organizer_dashboard(
                 "title": event.get("title"),
                 "start_time": event.get("start_time"),
                 "venue": event.get("venue", {}).get("name"),
-                "attendees_count": event.get("attendees_count", 0)
+                "attendees_count": event.get("attendees_count", 0),
+                "_parsed_start": event_time  # Naive sort key, parsed once; removed before returning
             }
             
             # Now both event_time and now are naive datetimes
@@ -187,12 +198,13 @@ async def get_organizer_dashboard(
                 past_events.append(simplified_event)
     
     # Sort upcoming events (soonest first)
-    upcoming_events.sort(key=lambda x: x.get("start_time") if isinstance(x.get("start_time"), datetime) 
-                        else datetime.min)
+    upcoming_events.sort(key=itemgetter("_parsed_start"))
     
     # Sort past events (most recent first)
-    past_events.sort(key=lambda x: x.get("start_time") if isinstance(x.get("start_time"), datetime) 
-                    else datetime.min, reverse=True)
+    past_events.sort(key=itemgetter("_parsed_start"), reverse=True)
+    
+    for simplified_event in upcoming_events + past_events:
+        del simplified_event["_parsed_start"]
     
     # Build the response with only the requested information
     dashboard_data = {
@@ -227,14 +239,14 @@ async def get_event_attendees_details(
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
     
-    # Get attendees
-    attendees = await firebase_service.get_event_attendees(event_id)
+    # The event document already carries its attendees; read their profiles in one batched lookup
+    attendees = event.get("attendees", [])
+    users_by_id = await firebase_service.get_users_bulk([attendee["user_id"] for attendee in attendees])
     
     # Enrich with user details but only include requested fields
     simplified_attendees = []
     for attendee in attendees:
-        user_id = attendee["user_id"]
-        user_details = await firebase_service.get_user(user_id)
+        user_details = users_by_id.get(attendee["user_id"])
         if user_details:
             simplified_attendee = {
                 "display_name": user_details.get("display_name", "Unknown"),
@@ -262,42 +274,43 @@ async def get_event_feedback_with_user_details(
     - List of feedback items with user details (display_name, profile image)
     - Overall average rating
     """
+    # The event and its feedback are independent reads
+    event, feedback_list = await asyncio.gather(
+        firebase_service.get_event(event_id),
+        firebase_service.get_event_feedback(event_id)
+    )
     # Check if event exists
-    event = await firebase_service.get_event(event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
     
-    # Get all feedback for the event
-    feedback_list = await firebase_service.get_event_feedback(event_id)
+    # Read every feedback author in one batched lookup
+    users_by_id = await firebase_service.get_users_bulk(
+        [feedback["user_id"] for feedback in feedback_list if feedback.get("user_id")]
+    )
     
-    # Calculate feedback stats
+    # Enrich feedback with user details and calculate feedback stats in the same pass
+    enriched_feedback = []
     rating_sum = 0
     rating_count = 0
-    
     for feedback in feedback_list:
-        if feedback.get("rating"):
-            rating_sum += feedback["rating"]
+        if rating := feedback.get("rating"):
+            rating_sum += rating
             rating_count += 1
+        
+        user_details = users_by_id.get(feedback.get("user_id"))
+        if user_details:
+            enriched_feedback_item = {
+                **feedback,
+                "user": {
+                    "user_id": feedback["user_id"],
+                    "display_name": user_details.get("display_name", "Unknown"),
+                    "profile_image_url": user_details.get("profile_image_url")
+                }
+            }
+            enriched_feedback.append(enriched_feedback_item)
     
     avg_rating = rating_sum / rating_count if rating_count > 0 else 0
     
-    # Enrich feedback with user details
-    enriched_feedback = []
-    for feedback in feedback_list:
-        user_id = feedback.get("user_id")
-        if user_id:
-            user_details = await firebase_service.get_user(user_id)
-            if user_details:
-                enriched_feedback_item = {
-                    **feedback,
-                    "user": {
-                        "user_id": user_id,
-                        "display_name": user_details.get("display_name", "Unknown"),
-                        "profile_image_url": user_details.get("profile_image_url")
-                    }
-                }
-                enriched_feedback.append(enriched_feedback_item)
-    
     return {
         "event_id": event_id,
         "feedback_count": len(enriched_feedback),
@@ -324,15 +337,14 @@ async def get_event_details_with_attendees(
     if "schedule" not in event:
         event["schedule"] = []
     
-    # Get attendees
-    attendees = await firebase_service.get_event_attendees(event_id)
+    # The event document already carries its attendees; read their profiles in one batched lookup
+    attendees = event.get("attendees", [])
+    users_by_id = await firebase_service.get_users_bulk([attendee["user_id"] for attendee in attendees])
     
     # Enrich attendees with display names
     enriched_attendees = []
     for attendee in attendees:
-        user_id = attendee["user_id"]
-        user_details = await firebase_service.get_user(user_id)
-        
+        user_details = users_by_id.get(attendee["user_id"])
         # Create a copy of the original attendee data
         enriched_attendee = attendee.copy()
         
@@ -2,44 +2,28 @@ from fastapi import APIRouter, HTTPException, Depends, Query
 from typing import List, Optional
 from datetime import datetime, timedelta
 
-from app.models.event import EventCreate, EventUpdate, Event, EventRSVP, EventFilter
+from app.models.event import EventCreate, EventUpdate, Event, EventRSVP, EventBulkRSVP, EventFilter
 from app.services.firebase_service import firebase_service
 from app.services.recommendation_service import recommendation_service
-from app.utils.validators import validate_event_dates, validate_coordinates, validate_rsvp_status
+from app.services.cache_service import cache_service, feed_tag
+from app.utils.validators import validate_coordinates, validate_rsvp_status
 from app.utils.location_utils import filter_events_by_distance
 
 router = APIRouter()
 
+async def _invalidate_organizer_dashboards(*emails: Optional[str]):
+    """Drop cached organizer dashboards after a write to one of their events"""
+    await cache_service.delete(*(f"org_dash:{email}" for email in set(emails) if email))
+
 @router.post("/", response_model=Event, status_code=201)
 async def create_event(event: EventCreate):
     """Create a new event"""
-    # Validate dates
-    if not validate_event_dates(event.start_time, event.end_time):
-        raise HTTPException(status_code=400, detail="End time must be after start time")
-    
-    # Validate coordinates
-    if not validate_coordinates(event.venue.latitude, event.venue.longitude):
-        raise HTTPException(status_code=400, detail="Invalid coordinates")
-    
-    # Validate schedule items if provided
-    if event.schedule:
-        for item in event.schedule:
-            # Check that each schedule item has valid start/end times
-            if not validate_event_dates(item.start_time, item.end_time):
-                raise HTTPException(status_code=400, detail="Schedule item end time must be after start time")
-            
-            # Check that schedule items are within the event time range
-            if item.start_time < event.start_time or item.end_time > event.end_time:
-                raise HTTPException(
-                    status_code=400, 
-                    detail="Schedule items must be within the event's start and end times"
-                )
-    
-    # Prepare event data
+    # Prepare event data (dates, coordinates and schedule items were validated by EventCreate)
     event_data = event.model_dump()
     
     # Create event
     created_event = await firebase_service.create_event(event_data)
+    await _invalidate_organizer_dashboards(event_data.get("organizer_email"))
     return created_event
 
 @router.get("/", response_model=List[Event])
@@ -131,22 +115,12 @@ async def update_event(event_id: str, event_update: EventUpdate):
     if not existing_event:
         raise HTTPException(status_code=404, detail="Event not found")
     
-    # Filter out None values
+    # Filter out None values (dates and venue coordinates were validated by EventUpdate)
     update_data = {k: v for k, v in event_update.model_dump().items() if v is not None}
     
-    # Validate dates if both are provided
-    if "start_time" in update_data and "end_time" in update_data:
-        if not validate_event_dates(update_data["start_time"], update_data["end_time"]):
-            raise HTTPException(status_code=400, detail="End time must be after start time")
-    
-    # Validate venue coordinates if provided
-    if "venue" in update_data:
-        venue = update_data["venue"]
-        if not validate_coordinates(venue.latitude, venue.longitude):
-            raise HTTPException(status_code=400, detail="Invalid coordinates")
-    
     # Update event
     updated_event = await firebase_service.update_event(event_id, update_data)
+    await _invalidate_organizer_dashboards(existing_event.get("organizer_email"), update_data.get("organizer_email"))
     return updated_event
 
 @router.delete("/{event_id}")
@@ -159,30 +133,35 @@ async def delete_event(event_id: str):
     
     # Delete event
     result = await firebase_service.delete_event(event_id)
+    await _invalidate_organizer_dashboards(existing_event.get("organizer_email"))
     return {"status": "success", "message": "Event deleted"}
 
-@router.post("/{event_id}/rsvp")
-async def update_event_rsvp(event_id: str, user_id: str, rsvp_data: EventRSVP):
-    """Update a user's RSVP status for an event"""
-    # Check if event exists
-    event = await firebase_service.get_event(event_id)
-    if not event:
-        raise HTTPException(status_code=404, detail="Event not found")
+async def _invalidate_feeds(user_ids: set):
+    """Drop the cached feeds of users whose connections just RSVPed"""
+    await cache_service.invalidate_tags(*(feed_tag(user_id) for user_id in user_ids))
+
+async def _update_rsvp_record(event_id: str, user_id: str, status: Optional[str], stale_feeds: set):
+    """Record a single attending RSVP, raising HTTPException on failure
     
+    The RSVP shows up in every connection's feed, so their IDs are added to stale_feeds
+    for the caller to invalidate once.
+    """
     # Check if user exists
     user = await firebase_service.get_user(user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
     # We only accept "attending" status now
-    if rsvp_data.status != "attending":
+    if status != "attending":
         raise HTTPException(status_code=400, detail="Only 'attending' status is supported")
     
     # Update RSVP
-    result = await firebase_service.update_event_rsvp(event_id, user_id, rsvp_data.status)
+    result = await firebase_service.update_event_rsvp(event_id, user_id, status)
     if not result:
         raise HTTPException(status_code=400, detail="Failed to update RSVP")
     
+    stale_feeds.update(user.get("connections", ()))
+    
     return {
         "status": "success",
         "message": "User is now attending this event",
@@ -190,6 +169,46 @@ async def update_event_rsvp(event_id: str, user_id: str, rsvp_data: EventRSVP):
         "user_id": user_id
     }
 
+@router.post("/{event_id}/rsvp")
+async def update_event_rsvp(event_id: str, user_id: str, rsvp_data: EventRSVP):
+    """Update a user's RSVP status for an event"""
+    # Check if event exists
+    event = await firebase_service.get_event(event_id)
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+    
+    stale_feeds = set()
+    result = await _update_rsvp_record(event_id, user_id, rsvp_data.status, stale_feeds)
+    await _invalidate_feeds(stale_feeds)
+    await _invalidate_organizer_dashboards(event.get("organizer_email"))
+    return result
+
+@router.post("/{event_id}/rsvp/bulk")
+async def update_event_rsvps_bulk(event_id: str, payload: EventBulkRSVP):
+    """
+    Update RSVP status for several users of an event in one request.
+    
+    Returns one result per input RSVP, in input order. Each result carries
+    its own status_code so a failure for one user doesn't fail the batch.
+    """
+    # Check if event exists
+    event = await firebase_service.get_event(event_id)
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+    
+    results = []
+    # Connections shared by several RSVPing users have their feeds invalidated once
+    stale_feeds = set()
+    for rsvp in payload.rsvps:
+        try:
+            result = await _update_rsvp_record(event_id, rsvp.user_id, rsvp.status, stale_feeds)
+            results.append({"status_code": 200, "result": result})
+        except HTTPException as e:
+            results.append({"status_code": e.status_code, "detail": e.detail})
+    await _invalidate_feeds(stale_feeds)
+    await _invalidate_organizer_dashboards(event.get("organizer_email"))
+    return {"results": results}
+
 @router.get("/{event_id}/attendees")
 async def get_event_attendees(
     event_id: str,
@@ -204,11 +223,12 @@ async def get_event_attendees(
     # Get attendees
     attendees = await firebase_service.get_event_attendees(event_id, status)
     
-    # Enrich with user details
+    # Enrich with user details, reading every attendee's profile in one batch
+    users = await firebase_service.get_users_bulk([attendee["user_id"] for attendee in attendees])
     enriched_attendees = []
     for attendee in attendees:
         user_id = attendee["user_id"]
-        user_details = await firebase_service.get_user(user_id)
+        user_details = users.get(user_id)
         if user_details:
             enriched_attendee = {
                 "user_id": user_id,
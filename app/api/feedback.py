@@ -1,11 +1,18 @@
+import asyncio
 from fastapi import APIRouter, HTTPException, Query, Path
 from typing import List, Optional
 
 from app.models.feedback import EventFeedbackCreate, EventFeedbackResponse
 from app.services.firebase_service import firebase_service
+from app.services.cache_service import cache_service
 
 router = APIRouter()
 
+async def _invalidate_organizer_dashboard(event: dict):
+    """Drop the cached dashboard of the event's organizer, whose ratings just changed"""
+    if event.get("organizer_email"):
+        await cache_service.delete(f"org_dash:{event['organizer_email']}")
+
 @router.post("/{event_id}", response_model=EventFeedbackResponse, status_code=201)
 async def create_feedback(
     event_id: str = Path(..., description="ID of the event to provide feedback for"),
@@ -26,6 +33,7 @@ async def create_feedback(
     # Create feedback
     feedback_data = feedback.dict()
     created_feedback = await firebase_service.create_event_feedback(event_id, user_id, feedback_data)
+    await _invalidate_organizer_dashboard(event)
     
     return {
         **created_feedback,
@@ -55,11 +63,8 @@ async def get_user_feedback_for_event(
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
     
-    # Get all feedback for the event
-    all_feedback = await firebase_service.get_event_feedback(event_id)
-    
-    # Find the specific user's feedback
-    user_feedback = next((f for f in all_feedback if f.get("user_id") == user_id), None)
+    # Feedback is keyed by user ID, so read the one document instead of scanning the event's feedback
+    user_feedback = await firebase_service.get_user_event_feedback(event_id, user_id)
     if not user_feedback:
         raise HTTPException(status_code=404, detail="Feedback not found")
     
@@ -78,14 +83,15 @@ async def get_all_user_feedback(
     # Get all events
     events = await firebase_service.get_events(limit=200)
     
+    # Read this user's feedback document for every event concurrently
+    event_feedback = await asyncio.gather(*(
+        firebase_service.get_user_event_feedback(event["id"], user_id) for event in events
+    ))
+    
     # Collect all feedback from this user across all events
     all_user_feedback = []
-    for event in events:
+    for event, user_feedback in zip(events, event_feedback):
         event_id = event["id"]
-        # Get feedback for this event
-        event_feedback = await firebase_service.get_event_feedback(event_id)
-        # Find this user's feedback if it exists
-        user_feedback = next((f for f in event_feedback if f.get("user_id") == user_id), None)
         if user_feedback:
             # Add event_id to the feedback object if not present
             if "event_id" not in user_feedback:
@@ -112,14 +118,14 @@ async def update_feedback(
         raise HTTPException(status_code=404, detail="User not found")
     
     # Check if feedback exists
-    all_feedback = await firebase_service.get_event_feedback(event_id)
-    existing_feedback = next((f for f in all_feedback if f.get("user_id") == user_id), None)
+    existing_feedback = await firebase_service.get_user_event_feedback(event_id, user_id)
     if not existing_feedback:
         raise HTTPException(status_code=404, detail="Feedback not found")
     
     # Update feedback
     feedback_data = feedback.dict()
     updated_feedback = await firebase_service.create_event_feedback(event_id, user_id, feedback_data)
+    await _invalidate_organizer_dashboard(event)
     
     return {
         **updated_feedback,
@@ -143,6 +149,7 @@ async def delete_feedback(
     success = await firebase_service.delete_event_feedback(event_id, user_id)
     if not success:
         raise HTTPException(status_code=404, detail="Feedback not found or could not be deleted")
+    await _invalidate_organizer_dashboard(event)
     
     return {"status": "success", "message": "Feedback deleted successfully"}
 
@@ -3,19 +3,16 @@ from fastapi import APIRouter, HTTPException, Depends, Query, Body
 from typing import List, Optional
 from datetime import datetime
 
-from app.models.user import UserCreate, UserUpdate, User, UserInterests, UserLocation
+from app.models.user import (
+    UserCreate, UserUpdate, User, UserInterests, UserLocation,
+    UserBulkCreate, UserBulkInterests, UserBulkLocations
+)
 from app.services.firebase_service import firebase_service
 
 router = APIRouter()
 
-@router.post("/", response_model=User, status_code=201)
-async def create_user(user: UserCreate):
-    """
-    Create a new user account.
-    
-    Note: Authentication is handled on the mobile client, this endpoint
-    creates the user record in our backend after Firebase auth is completed.
-    """
+async def _create_user_record(user: UserCreate):
+    """Create a single user record, raising HTTPException on conflicts"""
     # Generate a 6-digit UID if not provided
     if not user.uid:
         # Generate a random 6-digit number as string
@@ -53,6 +50,7 @@ async def create_user(user: UserCreate):
         
         # Delete the document
         firebase_user_doc.reference.delete()
+        firebase_service.invalidate_user(firebase_user_doc.id)
         print(f"Deleted document with Firebase UUID: {firebase_user_doc.id}")
         
         # Preserve important user data
@@ -73,7 +71,7 @@ async def create_user(user: UserCreate):
     user_data["created_at"] = datetime.now()
     
     # Initialize with empty arrays/zeros if not preserved from previous document
-    if "interests" not in user_data:
+    if user_data.get("interests") is None:
         user_data["interests"] = []
     if "events_attended" not in user_data:
         user_data["events_attended"] = 0
@@ -88,6 +86,76 @@ async def create_user(user: UserCreate):
     print(f"Created new user with 6-digit UID: {user.uid}")
     return created_user
 
+@router.post("/", response_model=User, status_code=201)
+async def create_user(user: UserCreate):
+    """
+    Create a new user account.
+    
+    Note: Authentication is handled on the mobile client, this endpoint
+    creates the user record in our backend after Firebase auth is completed.
+    """
+    return await _create_user_record(user)
+
+@router.post("/bulk")
+async def create_users_bulk(payload: UserBulkCreate):
+    """
+    Create several user accounts in one request.
+    
+    Returns one result per input user, in input order. Each result carries
+    its own status_code so a conflict on one user doesn't fail the batch.
+    """
+    results = []
+    for user in payload.users:
+        try:
+            created_user = await _create_user_record(user)
+            results.append({"status_code": 201, "result": created_user})
+        except HTTPException as e:
+            results.append({"status_code": e.status_code, "detail": e.detail})
+    return {"results": results}
+
+@router.post("/interests/bulk")
+async def update_user_interests_bulk(payload: UserBulkInterests):
+    """Update interests for several users in one request"""
+    existing_users = await firebase_service.get_users_bulk([item.uid for item in payload.users])
+    
+    # All found users are written in one batch, then re-read together for the results
+    await firebase_service.batch_update_users({
+        item.uid: {"interests": item.interests} for item in payload.users if item.uid in existing_users
+    })
+    updated_users = await firebase_service.get_users_bulk(list(existing_users))
+    
+    results = []
+    for item in payload.users:
+        if item.uid not in existing_users:
+            results.append({"status_code": 404, "detail": "User not found"})
+            continue
+        
+        results.append({"status_code": 200, "result": updated_users.get(item.uid)})
+    return {"results": results}
+
+@router.post("/locations")
+async def update_user_locations_bulk(payload: UserBulkLocations):
+    """Update current locations for several users in one request"""
+    existing_users = await firebase_service.get_users_bulk([item.uid for item in payload.users])
+    
+    results = []
+    location_updates = {}
+    for item in payload.users:
+        if item.uid not in existing_users:
+            results.append({"status_code": 404, "detail": "User not found"})
+            continue
+        
+        location_updates[item.uid] = {
+            "latitude": item.latitude,
+            "longitude": item.longitude,
+            "location_updated_at": datetime.now()
+        }
+        results.append({"status_code": 200, "result": {"status": "success", "message": "Location updated"}})
+    
+    # One batched write instead of an update round-trip per user
+    await firebase_service.batch_update_users(location_updates)
+    return {"results": results}
+
 @router.get("/{user_id}", response_model=User)
 async def get_user(user_id: str):
     """Get user profile by ID"""
@@ -153,9 +221,9 @@ async def get_user_events(
     
     user_events = []
     for event in all_events:
-        # Check if user is in attendees
-        attendees = await firebase_service.get_event_attendees(event["id"])
-        user_attendance = next((a for a in attendees if a["user_id"] == user_id), None)
+        # Check if user is in attendees (the event documents already carry them; no per-event read)
+        attendees = event.get("attendees", [])
+        user_attendance = next((a for a in attendees if a.get("user_id") == user_id), None)
         
         if user_attendance:
             # We only support "attending" status now, so no need to check status
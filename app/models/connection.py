@@ -1,8 +1,9 @@
 from typing import Optional, List
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime, timedelta
 from fastapi import APIRouter, Query, HTTPException
 from app.services import firebase_service
+from app.models.user import BULK_MAX_ITEMS
 
 class ConnectionStatus(BaseModel):
     status: Optional[str] = None  # "pending", "accepted", "declined", "blocked"
@@ -10,13 +11,29 @@ class ConnectionStatus(BaseModel):
     updated_at: Optional[datetime] = None
 
 class ConnectionRequest(BaseModel):
-    from_user_id: Optional[str] = None  # Add this field
-    to_user_id: Optional[str] = None
+    from_user_id: str = Field(..., min_length=1, max_length=128)
+    to_user_id: str = Field(..., min_length=1, max_length=128)
+    
+    class Config:
+        extra = "forbid"
+        frozen = True
+        str_strip_whitespace = True
+
+class ConnectionBulkRequest(BaseModel):
+    requests: List[ConnectionRequest] = Field(default=[], max_length=BULK_MAX_ITEMS)
 
 class ConnectionResponse(BaseModel):
-    request_id: Optional[str] = None
-    user_id: Optional[str] = None  # ID of the user responding (moved from query param)
+    request_id: str = Field(..., min_length=1, max_length=128)  # ID of the user who sent the request
+    user_id: str = Field(..., min_length=1, max_length=128)  # ID of the user responding (moved from query param)
     status: Optional[str] = None  # "accept" or "decline"
+    
+    class Config:
+        extra = "forbid"
+        frozen = True
+        str_strip_whitespace = True
+
+class ConnectionBulkResponse(BaseModel):
+    responses: List[ConnectionResponse] = Field(default=[], max_length=BULK_MAX_ITEMS)
 
 class ConnectionSuggestion(BaseModel):
     user_id: Optional[str] = None
@@ -58,8 +75,9 @@ async def get_connections_activity(
     
     # Get user's connections
     connections = await firebase_service.get_user_connections(user_id, status="accepted")
-    connection_ids = [conn["from_user_id"] if conn["to_user_id"] == user_id else conn["to_user_id"] 
-                      for conn in connections]
+    # A set, since it's probed once per attendee of every event below
+    connection_ids = {conn["from_user_id"] if conn["to_user_id"] == user_id else conn["to_user_id"] 
+                      for conn in connections}
     
     if not connection_ids:
         return []
@@ -137,4 +155,4 @@ async def get_connections_activity(
     # Return limited number of activities
     return activity_feed[:limit]
 
-__all__ = ["ConnectionStatus", "ConnectionRequest", "ConnectionResponse", "ConnectionSuggestion", "ConnectionRecommendation"]
\ No newline at end of file
+__all__ = ["ConnectionStatus", "ConnectionRequest", "ConnectionBulkRequest", "ConnectionResponse", "ConnectionBulkResponse", "ConnectionSuggestion", "ConnectionRecommendation"]
\ No newline at end of file
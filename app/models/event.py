@@ -1,13 +1,29 @@
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, Field, EmailStr, field_validator, model_validator
 from datetime import datetime
 
+from app.models.user import BULK_MAX_ITEMS
+
 class Venue(BaseModel):
     name: Optional[str] = None
     address: Optional[str] = None
     latitude: Optional[float] = None
     longitude: Optional[float] = None
     description: Optional[str] = None
+    
+    @field_validator('latitude')
+    @classmethod
+    def check_latitude(cls, latitude: Optional[float]) -> Optional[float]:
+        if latitude is not None and not -90 <= latitude <= 90:
+            raise ValueError("Latitude must be between -90 and 90")
+        return latitude
+    
+    @field_validator('longitude')
+    @classmethod
+    def check_longitude(cls, longitude: Optional[float]) -> Optional[float]:
+        if longitude is not None and not -180 <= longitude <= 180:
+            raise ValueError("Longitude must be between -180 and 180")
+        return longitude
 
 class ScheduleItem(BaseModel):
     title: str
@@ -34,7 +50,19 @@ class EventBase(BaseModel):
     schedule: Optional[List[ScheduleItem]] = None  # New field for event schedule
 
 class EventCreate(EventBase):
-    pass
+    @model_validator(mode='after')
+    def check_times_and_venue(self) -> 'EventCreate':
+        # Checked while the payload is parsed, so invalid events are rejected with a 422
+        if self.start_time is None or self.end_time is None or self.end_time <= self.start_time:
+            raise ValueError("End time must be after start time")
+        if self.venue is None or self.venue.latitude is None or self.venue.longitude is None:
+            raise ValueError("Venue latitude and longitude are required")
+        for item in self.schedule or []:
+            if item.end_time <= item.start_time:
+                raise ValueError("Schedule item end time must be after start time")
+            if item.start_time < self.start_time or item.end_time > self.end_time:
+                raise ValueError("Schedule items must be within the event's start and end times")
+        return self
 
 class EventUpdate(BaseModel):
     title: Optional[str] = None
@@ -48,10 +76,25 @@ class EventUpdate(BaseModel):
     organizer_name: Optional[str] = None
     website_url: Optional[str] = None
     max_attendees: Optional[int] = None
+    
+    @model_validator(mode='after')
+    def check_times_and_venue(self) -> 'EventUpdate':
+        # Only the fields being updated are checked
+        if self.start_time and self.end_time and self.end_time <= self.start_time:
+            raise ValueError("End time must be after start time")
+        if self.venue is not None and (self.venue.latitude is None or self.venue.longitude is None):
+            raise ValueError("Venue latitude and longitude are required")
+        return self
 
 class EventRSVP(BaseModel):
     status: Optional[str] = Field(None, description="One of: attending, interested, declined")
 
+class EventRSVPItem(EventRSVP):
+    user_id: str
+
+class EventBulkRSVP(BaseModel):
+    rsvps: List[EventRSVPItem] = Field(default=[], max_length=BULK_MAX_ITEMS)
+
 class EventAttendee(BaseModel):
     user_id: Optional[str] = None
     status: Optional[str] = None
@@ -80,4 +123,4 @@ class EventFilter(BaseModel):
     longitude: Optional[float] = None
 
 
-__all__ = ["Venue", "EventBase", "EventCreate", "EventUpdate", "EventRSVP", "EventAttendee", "Event", "EventFilter"]
\ No newline at end of file
+__all__ = ["Venue", "EventBase", "EventCreate", "EventUpdate", "EventRSVP", "EventRSVPItem", "EventBulkRSVP", "EventAttendee", "Event", "EventFilter"]
\ No newline at end of file
@@ -2,6 +2,9 @@ from typing import List, Optional
 from pydantic import BaseModel, EmailStr, Field
 from datetime import datetime
 
+# Most items a single bulk request may carry
+BULK_MAX_ITEMS = 100
+
 class UserBase(BaseModel):
     display_name: Optional[str] = None
     email: Optional[EmailStr] = None
@@ -10,6 +13,7 @@ class UserBase(BaseModel):
 
 class UserCreate(UserBase):
     uid: Optional[str] = None  # Firebase UID
+    interests: Optional[List[str]] = None  # Optional initial interests
 
 class UserUpdate(BaseModel):
     display_name: Optional[str] = None
@@ -19,10 +23,25 @@ class UserUpdate(BaseModel):
 class UserInterests(BaseModel):
     interests: Optional[List[str]] = Field(default=[])
 
+class UserBulkCreate(BaseModel):
+    users: List[UserCreate] = Field(default=[], max_length=BULK_MAX_ITEMS)
+
+class UserInterestsItem(UserInterests):
+    uid: str
+
+class UserBulkInterests(BaseModel):
+    users: List[UserInterestsItem] = Field(default=[], max_length=BULK_MAX_ITEMS)
+
 class UserLocation(BaseModel):
     latitude: Optional[float] = None
     longitude: Optional[float] = None
 
+class UserLocationItem(UserLocation):
+    uid: str
+
+class UserBulkLocations(BaseModel):
+    users: List[UserLocationItem] = Field(default=[], max_length=BULK_MAX_ITEMS)
+
 class User(UserBase):
     uid: Optional[str] = None
     interests: Optional[List[str]] = []
@@ -35,4 +54,6 @@ class User(UserBase):
     class Config:
         from_attributes = True
 
-__all__ = ["UserBase", "UserCreate", "UserUpdate", "UserInterests", "UserLocation", "User"]
+__all__ = ["UserBase", "UserCreate", "UserUpdate", "UserInterests", "UserBulkCreate", "UserInterestsItem",
+           "UserBulkInterests", "UserLocation",
+           "UserLocationItem", "UserBulkLocations", "User"]
@@ -0,0 +1,163 @@
+import logging
+import orjson
+import redis.asyncio as redis
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+from config import settings
+
+log = logging.getLogger(__name__)
+
+# Seconds a tag's key set is kept; longer than any cached value it indexes
+TAG_TTL = 3600
+# Most values kept by the in-process fallback when Redis isn't configured; the oldest are evicted first
+LOCAL_CACHE_MAXSIZE = 10_000
+
+def _tag_key(tag: str) -> str:
+    return f"tag:{tag}"
+
+def conn_tag(user_id: str) -> str:
+    """Tag for every cached value derived from the user's connections"""
+    return f"conn:{user_id}"
+
+def feed_tag(user_id: str) -> str:
+    """Tag for the user's cached feeds, which their connections' RSVPs also change"""
+    return f"feed:{user_id}"
+
+def _json_default(value: Any):
+    # Firestore timestamps are datetime subclasses; sentinels and the rest fall back to str
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+def to_json(value: Any) -> bytes:
+    """Encode a response value as JSON bytes the same way cached values are stored"""
+    return orjson.dumps(value, default=_json_default)
+
+class CacheService:
+    def __init__(self):
+        # No Redis configured means values are cached in this process only
+        self.client = redis.from_url(settings.REDIS_URL) if settings.REDIS_URL else None
+        self._local = OrderedDict()  # key -> (expires_at, data, tags), oldest first
+        self._local_tags = {}  # tag -> keys in _local recorded under it
+
+    def _local_get(self, key: str) -> Optional[bytes]:
+        """Return the locally cached bytes for key if they haven't expired"""
+        cached = self._local.get(key)
+        if cached is None:
+            return None
+        if cached[0] <= time.monotonic():
+            self._local_delete(key)
+            return None
+        return cached[1]
+
+    def _local_set(self, key: str, data: bytes, ttl: int, tags: Iterable[str]):
+        """Cache bytes locally, evicting the oldest entries past LOCAL_CACHE_MAXSIZE"""
+        tags = tuple(tags)
+        self._local_delete(key)
+        self._local[key] = (time.monotonic() + ttl, data, tags)
+        for tag in tags:
+            self._local_tags.setdefault(tag, set()).add(key)
+        while len(self._local) > LOCAL_CACHE_MAXSIZE:
+            self._local_delete(next(iter(self._local)))
+
+    def _local_delete(self, key: str):
+        """Drop a locally cached key and its tag references"""
+        cached = self._local.pop(key, None)
+        if cached is None:
+            return
+        for tag in cached[2]:
+            keys = self._local_tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._local_tags[tag]
+
+    async def get_raw(self, key: str) -> Optional[bytes]:
+        """Return the cached JSON bytes for key, or None on a miss"""
+        if self.client is None:
+            return self._local_get(key)
+
+        try:
+            return await self.client.get(key)
+        except redis.RedisError as e:
+            log.warning("cache read failed for %s: %s", key, e)
+            return None
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss"""
+        cached = await self.get_raw(key)
+        return orjson.loads(cached) if cached is not None else None
+
+    async def set_raw(self, key: str, data: bytes, ttl: int, tags: Iterable[str] = ()):
+        """Cache already-encoded JSON bytes under key for ttl seconds
+        
+        The key is recorded under each tag so invalidate_tags can drop it without scanning.
+        """
+        if self.client is None:
+            self._local_set(key, data, ttl, tags)
+            return
+
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.set(key, data, ex=ttl)
+            for tag in tags:
+                pipe.sadd(_tag_key(tag), key)
+                pipe.expire(_tag_key(tag), TAG_TTL)
+            await pipe.execute()
+        except redis.RedisError as e:
+            log.warning("cache write failed for %s: %s", key, e)
+
+    async def set(self, key: str, value: Any, ttl: int, tags: Iterable[str] = ()):
+        """Cache value under key for ttl seconds"""
+        await self.set_raw(key, to_json(value), ttl, tags)
+
+    async def get_or_set(self, key: str, factory: Callable[[], Awaitable[Any]], ttl: int,
+                         tags: Iterable[str] = ()) -> Any:
+        """Return the cached value for key, or compute it with factory and cache it for ttl seconds"""
+        cached = await self.get(key)
+        if cached is not None:
+            return cached
+
+        value = await factory()
+        await self.set(key, value, ttl, tags)
+        return value
+
+    async def delete(self, *keys: str):
+        """Delete the given cached keys"""
+        if self.client is None:
+            for key in keys:
+                self._local_delete(key)
+            return
+        if not keys:
+            return
+
+        try:
+            await self.client.delete(*keys)
+        except redis.RedisError as e:
+            log.warning("cache delete failed for %s: %s", keys, e)
+
+    async def invalidate_tags(self, *tags: str):
+        """Delete every cached key recorded under any of the given tags"""
+        if self.client is None:
+            for tag in tags:
+                for key in list(self._local_tags.get(tag, ())):
+                    self._local_delete(key)
+            return
+        if not tags:
+            return
+
+        tag_keys = [_tag_key(tag) for tag in tags]
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for tag_key in tag_keys:
+                pipe.smembers(tag_key)
+            members = await pipe.execute()
+            await self.client.delete(*tag_keys, *(key for keys in members for key in keys))
+        except redis.RedisError as e:
+            log.warning("cache invalidation failed for %s: %s", tags, e)
+
+cache_service = CacheService()# Initialize service
+__all__ = ["cache_service", "conn_tag", "feed_tag", "to_json"]
@@ -1,57 +1,195 @@
 from firebase_admin import db, storage, firestore
+from google.api_core.exceptions import AlreadyExists
 from typing import Dict, Any, List, Optional
+import asyncio
 import json
-from datetime import datetime
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
 
 # Import the config module to initialize Firebase
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-from config import db as firebase_db  # This will execute the initialization code
+from config import db as firebase_db, settings  # This will execute the initialization code
+from app.utils.time_utils import to_utc
+
+# Users per batched read in get_users_bulk (matches Firestore's "in" query limit)
+USERS_BULK_CHUNK_SIZE = 30
+# Most user documents kept in the process-local cache; the least recently used are evicted first
+USER_CACHE_MAXSIZE = 50_000
+# Most connection queries kept in the process-local cache; the least recently used are evicted first
+CONNECTIONS_CACHE_MAXSIZE = 10_000
+# Firestore rejects write batches with more operations than this
+BATCH_WRITE_LIMIT = 500
 
 class FirebaseService:
     def __init__(self):
-        self.db = firestore.client()
+        # The one client created in config; every service shares it and its gRPC channel
+        self.db = firebase_db
+        self._user_cache = OrderedDict()  # user_id -> (expires_at, user_data), least recently used first
+        self.user_cache_ttl = 60  # Seconds a cached user read stays valid (writes invalidate sooner)
+        self._user_reads = {}  # user_id -> in-flight read task shared by concurrent cache misses
+        self._connections_cache = OrderedDict()  # (user_id, status) -> (expires_at, connections), least recently used first
+        self.connections_cache_ttl = 30  # Seconds a cached connections query stays valid
+        # Blocking Firestore calls made on behalf of request handlers run here, off the event loop
+        self._pool = ThreadPoolExecutor(max_workers=settings.FIRESTORE_MAX_WORKERS, thread_name_prefix='fs')
+    
+    async def _run(self, fn, *args):
+        """Run a blocking Firestore call on the service's thread pool"""
+        return await asyncio.get_running_loop().run_in_executor(self._pool, partial(fn, *args))
+    
+    @staticmethod
+    def _stream_dicts(query) -> List[Dict[str, Any]]:
+        """Materialize a query's documents as dicts (blocking)"""
+        return [doc.to_dict() for doc in query.stream()]
+    
+    def _cached_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Return the cached user document if it's still valid, marking it recently used"""
+        cached = self._user_cache.get(user_id)
+        if cached and cached[0] > time.monotonic():
+            self._user_cache.move_to_end(user_id)
+            return cached[1]
+        return None
+    
+    def _cache_user(self, user_id: str, user_data: Optional[Dict[str, Any]]):
+        """Remember a freshly read user document"""
+        if user_data is not None:
+            self._user_cache[user_id] = (time.monotonic() + self.user_cache_ttl, user_data)
+            self._user_cache.move_to_end(user_id)
+            if len(self._user_cache) > USER_CACHE_MAXSIZE:
+                self._user_cache.popitem(last=False)
+    
+    def invalidate_user(self, *user_ids: str):
+        """Drop cached user documents after they were written outside update_user"""
+        for user_id in user_ids:
+            self._user_cache.pop(user_id, None)
+            # A read already in flight may return the old document, so don't let it fill the cache
+            self._user_reads.pop(user_id, None)
+    
+    def invalidate_connections(self, *user_ids: str):
+        """Drop cached connection queries (every status filter) for users whose connections changed"""
+        user_ids = set(user_ids)
+        for key in [key for key in self._connections_cache if key[0] in user_ids]:
+            del self._connections_cache[key]
+    
+    def _invalidate_connection_id(self, connection_id: str):
+        """Drop cached connection queries that include the given connection document"""
+        for key in [key for key, (_, connections) in self._connections_cache.items()
+                    if any(conn.get('id') == connection_id for conn in connections)]:
+            del self._connections_cache[key]
         
     # User methods
     async def create_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new user in Firestore"""
         user_ref = self.db.collection('users').document(user_data['uid'])
         user_data['created_at'] = firestore.SERVER_TIMESTAMP
-        user_ref.set(user_data)
-        created_user = user_ref.get().to_dict()
+        await self._run(user_ref.set, user_data)
+        created_user = (await self._run(user_ref.get)).to_dict()
+        self._cache_user(user_data['uid'], created_user)
         return created_user
     
     async def get_user(self, user_id: str) -> Optional[Dict[str, Any]]:
-        """Get a user by ID"""
-        user_ref = self.db.collection('users').document(user_id)
-        user = user_ref.get()
-        if user.exists:
-            return user.to_dict()
-        return None
+        """Get a user by ID, served from a short-lived cache when possible"""
+        cached = self._cached_user(user_id)
+        if cached is not None:
+            return dict(cached)
+        
+        # Concurrent misses for the same user share one Firestore read
+        read = self._user_reads.get(user_id)
+        if read is None:
+            read = asyncio.ensure_future(self._read_user(user_id))
+            self._user_reads[user_id] = read
+            read.add_done_callback(partial(self._forget_user_read, user_id))
+        
+        # Shielded so one cancelled caller doesn't cancel the read for the others
+        user_data = await asyncio.shield(read)
+        return dict(user_data) if user_data is not None else None
+    
+    def _forget_user_read(self, user_id: str, read: asyncio.Future):
+        """Drop a finished read, unless a newer one for the same user has replaced it"""
+        if self._user_reads.get(user_id) is read:
+            del self._user_reads[user_id]
+    
+    async def _read_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Read a user document and cache it, unless it was invalidated while the read was in flight"""
+        user = await self._run(self.db.collection('users').document(user_id).get)
+        if not user.exists:
+            return None
+        user_data = user.to_dict()
+        if self._user_reads.get(user_id) is asyncio.current_task():
+            self._cache_user(user_id, user_data)
+        return user_data
+    
+    async def get_users_bulk(self, user_ids: List[str], fields: List[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Get several users in one batched read, keyed by user ID (missing users are omitted)
+        
+        Pass fields to read only those fields of each document (a Firestore field mask).
+        """
+        users = {}
+        missing_ids = []
+        for user_id in dict.fromkeys(user_ids):
+            # A cached full document also satisfies a field-masked read
+            cached = self._cached_user(user_id)
+            if cached is not None:
+                users[user_id] = dict(cached)
+            else:
+                missing_ids.append(user_id)
+        if not missing_ids:
+            return users
+        
+        users_ref = self.db.collection('users')
+        refs = [users_ref.document(user_id) for user_id in missing_ids]
+        # Large id lists are split into chunks that are read concurrently on the pool
+        chunks = [refs[i:i + USERS_BULK_CHUNK_SIZE] for i in range(0, len(refs), USERS_BULK_CHUNK_SIZE)]
+        results = await asyncio.gather(*(
+            self._run(lambda chunk=chunk: list(self.db.get_all(chunk, field_paths=fields))) for chunk in chunks
+        ))
+        for snaps in results:
+            for snap in snaps:
+                if snap.exists:
+                    users[snap.id] = snap.to_dict()
+                    # Warm the cache so follow-up get_user calls are free (partial reads can't be cached)
+                    if fields is None:
+                        self._cache_user(snap.id, dict(users[snap.id]))
+        return users
     
     async def update_user(self, user_id: str, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update user data"""
         user_ref = self.db.collection('users').document(user_id)
         user_data['updated_at'] = firestore.SERVER_TIMESTAMP
-        user_ref.update(user_data)
-        updated_user = user_ref.get().to_dict()
+        await self._run(user_ref.update, user_data)
+        updated_user = (await self._run(user_ref.get)).to_dict()
+        self._cache_user(user_id, updated_user)
         return updated_user
     
+    async def batch_update_users(self, updates: Dict[str, Dict[str, Any]]) -> None:
+        """Apply several user updates (user ID -> fields) as atomic batch writes"""
+        users_ref = self.db.collection('users')
+        items = list(updates.items())
+        for i in range(0, len(items), BATCH_WRITE_LIMIT):
+            batch = self.db.batch()
+            for user_id, user_data in items[i:i + BATCH_WRITE_LIMIT]:
+                batch.update(users_ref.document(user_id), {**user_data, 'updated_at': firestore.SERVER_TIMESTAMP})
+            await self._run(batch.commit)
+        self.invalidate_user(*updates)
+    
     # Event methods
     async def create_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new event"""
         event_ref = self.db.collection('events').document()
         event_data['id'] = event_ref.id
         event_data['created_at'] = firestore.SERVER_TIMESTAMP
-        event_ref.set(event_data)
-        created_event = event_ref.get().to_dict()
+        await self._run(event_ref.set, event_data)
+        created_event = (await self._run(event_ref.get)).to_dict()
         return created_event
     
     async def get_event(self, event_id: str) -> Optional[Dict[str, Any]]:
         """Get an event by ID"""
         event_ref = self.db.collection('events').document(event_id)
-        event = event_ref.get()
+        event = await self._run(event_ref.get)
         if event.exists:
             return event.to_dict()
         return None
@@ -60,14 +198,14 @@ class FirebaseService:
         """Update event data"""
         event_ref = self.db.collection('events').document(event_id)
         event_data['updated_at'] = firestore.SERVER_TIMESTAMP
-        event_ref.update(event_data)
-        updated_event = event_ref.get().to_dict()
+        await self._run(event_ref.update, event_data)
+        updated_event = (await self._run(event_ref.get)).to_dict()
         return updated_event
     
     async def delete_event(self, event_id: str) -> bool:
         """Delete an event"""
         event_ref = self.db.collection('events').document(event_id)
-        event_ref.delete()
+        await self._run(event_ref.delete)
         return True
     
     async def get_events(self, filters: Dict[str, Any] = None, limit: int = 50) -> List[Dict[str, Any]]:
@@ -88,61 +226,182 @@ class FirebaseService:
             if 'free_only' in filters and filters['free_only']:
                 query = query.where('price', '==', 0)
         
-        events = []
-        for doc in query.stream():
-            events.append(doc.to_dict())
-            
-        return events
+        return await self._run(self._stream_dicts, query)
+    
+    async def get_events_by_organizer(self, email: str, limit: int = None) -> List[Dict[str, Any]]:
+        """Get the events organized by an email address, filtered in the query rather than client-side"""
+        query = self.db.collection('events').where('organizer_email', '==', email)
+        if limit:
+            query = query.limit(limit)
+        return await self._run(self._stream_dicts, query)
+    
+    async def get_events_attended_by(self, user_ids, start_date: datetime = None, limit: int = 100,
+                                     fields: List[str] = None) -> List[Dict[str, Any]]:
+        """Get events at least one of user_ids is attending, using the attendee_ids array index
+        
+        Pass fields to read only those fields of each event (a Firestore field mask).
+        """
+        user_ids = list(user_ids)
+        events_ref = self.db.collection('events')
+        queries = []
+        # array_contains_any takes at most 30 values, so larger id sets are queried in chunks
+        for i in range(0, len(user_ids), USERS_BULK_CHUNK_SIZE):
+            query = events_ref.where('attendee_ids', 'array_contains_any', user_ids[i:i + USERS_BULK_CHUNK_SIZE])
+            if start_date:
+                query = query.where('start_time', '>=', start_date)
+            if fields:
+                query = query.select(fields)
+            queries.append(query.limit(limit))
+        
+        results = await asyncio.gather(*(self._run(self._stream_dicts, query) for query in queries))
+        # An event attended by users from several chunks comes back more than once
+        events = {}
+        for chunk_events in results:
+            for event in chunk_events:
+                events.setdefault(event['id'], event)
+        return list(events.values())
     
     # Connection methods
-    async def create_connection_request(self, from_user_id: str, to_user_id: str) -> Dict[str, Any]:
-        """Create a connection request between users"""
-        connection_ref = self.db.collection('connections').document()
+    def _connection_pair_id(self, user_a: str, user_b: str) -> str:
+        """Deterministic connection document ID for a pair of users, independent of direction"""
+        return "_".join(sorted((user_a, user_b)))
+    
+    def _count_pending_incoming(self, user_id: str) -> int:
+        """Count pending requests sent to user_id (blocking)"""
+        query = (self.db.collection('connections')
+                 .where('participants', 'array_contains', user_id)
+                 .where('status', '==', 'pending')
+                 .select(['to_user_id']))
+        return sum(1 for conn in query.stream() if conn.get('to_user_id') == user_id)
+    
+    async def _pending_count_change(self, user_id: str, delta: int):
+        """Value to write to user_id's pending counter when a pending request to them is added or removed
+        
+        Users whose document predates the counter get their true count written instead,
+        since incrementing the missing field would start it from 0.
+        """
+        user = await self.get_user(user_id)
+        if user is not None and 'pending_incoming_count' in user:
+            return firestore.Increment(delta)
+        # Counted before the write, so the request being added or removed is adjusted for here
+        return max(await self._run(self._count_pending_incoming, user_id) + delta, 0)
+    
+    async def create_connection_request(self, from_user_id: str, to_user_id: str) -> Optional[Dict[str, Any]]:
+        """Create a connection request between users
+        
+        Returns None if the pair already has a connection document. The create is
+        atomic with the counter increment, so a concurrent request or accept for the
+        same pair can't be overwritten back to pending or counted twice.
+        """
+        connection_ref = self.db.collection('connections').document(self._connection_pair_id(from_user_id, to_user_id))
         connection_data = {
             'id': connection_ref.id,
             'from_user_id': from_user_id,
             'to_user_id': to_user_id,
+            # Lets a single array_contains query find the connection from either side
+            'participants': sorted((from_user_id, to_user_id)),
             'status': 'pending',
             'created_at': firestore.SERVER_TIMESTAMP
         }
-        connection_ref.set(connection_data)
+        # The recipient's pending counter lets /pending-requests skip the query when it is zero
+        batch = self.db.batch()
+        batch.create(connection_ref, connection_data)
+        batch.update(self.db.collection('users').document(to_user_id), {
+            'pending_incoming_count': await self._pending_count_change(to_user_id, 1)
+        })
+        try:
+            await self._run(batch.commit)
+        except AlreadyExists:
+            return None
+        self.invalidate_user(to_user_id)
+        self.invalidate_connections(from_user_id, to_user_id)
         return connection_data
     
     async def update_connection_status(self, connection_id: str, status: str) -> Dict[str, Any]:
         """Update connection request status"""
         connection_ref = self.db.collection('connections').document(connection_id)
-        connection_ref.update({
+        await self._run(connection_ref.update, {
             'status': status,
             'updated_at': firestore.SERVER_TIMESTAMP
         })
-        return connection_ref.get().to_dict()
+        self._invalidate_connection_id(connection_id)
+        return (await self._run(connection_ref.get)).to_dict()
+    
+    async def accept_connection(self, connection_id: str, from_user_id: str, to_user_id: str,
+                                was_pending: bool = True) -> None:
+        """Accept a connection request and link both users in one atomic batch write"""
+        users_ref = self.db.collection('users')
+        batch = self.db.batch()
+        batch.update(self.db.collection('connections').document(connection_id), {
+            'status': 'accepted',
+            'updated_at': firestore.SERVER_TIMESTAMP
+        })
+        # Increment/ArrayUnion apply server-side, so no read-modify-write of the user docs
+        batch.update(users_ref.document(from_user_id), {
+            'connection_count': firestore.Increment(1),
+            'connections': firestore.ArrayUnion([to_user_id]),
+            'updated_at': firestore.SERVER_TIMESTAMP
+        })
+        to_user_update = {
+            'connection_count': firestore.Increment(1),
+            'connections': firestore.ArrayUnion([from_user_id]),
+            'updated_at': firestore.SERVER_TIMESTAMP
+        }
+        if was_pending:
+            to_user_update['pending_incoming_count'] = await self._pending_count_change(to_user_id, -1)
+        batch.update(users_ref.document(to_user_id), to_user_update)
+        await self._run(batch.commit)
+        self.invalidate_user(from_user_id, to_user_id)
+        self.invalidate_connections(from_user_id, to_user_id)
+    
+    async def delete_connection(self, connection_id: str, pending_to_user_id: str = None) -> bool:
+        """Delete a connection document
+        
+        Pass pending_to_user_id when deleting a pending request so the recipient's
+        pending counter is decremented in the same batch.
+        """
+        batch = self.db.batch()
+        batch.delete(self.db.collection('connections').document(connection_id))
+        if pending_to_user_id:
+            batch.update(self.db.collection('users').document(pending_to_user_id), {
+                'pending_incoming_count': await self._pending_count_change(pending_to_user_id, -1)
+            })
+        await self._run(batch.commit)
+        if pending_to_user_id:
+            self.invalidate_user(pending_to_user_id)
+        self._invalidate_connection_id(connection_id)
+        return True
     
     async def get_user_connections(self, user_id: str, status: str = None) -> List[Dict[str, Any]]:
         """Get user's connections with optional status filter"""
-        connections = []
-        
-        # Get connections where user is the requester
-        from_query = self.db.collection('connections').where('from_user_id', '==', user_id)
+        key = (user_id, status)
+        cached = self._connections_cache.get(key)
+        if cached:
+            if cached[0] > time.monotonic():
+                self._connections_cache.move_to_end(key)
+                return [dict(conn) for conn in cached[1]]
+            del self._connections_cache[key]
+        
+        # One query covers both directions (needs the participants+status composite index)
+        query = self.db.collection('connections').where('participants', 'array_contains', user_id)
         if status:
-            from_query = from_query.where('status', '==', status)
-            
-        for doc in from_query.stream():
-            connections.append(doc.to_dict())
-            
-        # Get connections where user is the receiver
-        to_query = self.db.collection('connections').where('to_user_id', '==', user_id)
-        if status:
-            to_query = to_query.where('status', '==', status)
-            
-        for doc in to_query.stream():
-            connections.append(doc.to_dict())
-            
-        return connections
+            query = query.where('status', '==', status)
+        
+        connections = await self._run(self._stream_dicts, query)
+        self._connections_cache[key] = (time.monotonic() + self.connections_cache_ttl, connections)
+        self._connections_cache.move_to_end(key)
+        if len(self._connections_cache) > CONNECTIONS_CACHE_MAXSIZE:
+            self._connections_cache.popitem(last=False)
+        return [dict(conn) for conn in connections]
+    
+    async def get_connection_by_pair(self, user_a: str, user_b: str) -> Optional[Dict[str, Any]]:
+        """Get the connection between two users, in either direction"""
+        return await self.get_connection(self._connection_pair_id(user_a, user_b))
     
     async def get_connection(self, connection_id: str) -> Dict[str, Any]:
         """Get a single connection by ID"""
         connection_ref = self.db.collection('connections').document(connection_id)
-        connection = connection_ref.get()
+        connection = await self._run(connection_ref.get)
         if connection.exists:
             return connection.to_dict()
         return None
@@ -155,7 +414,7 @@ class FirebaseService:
             return None
         
         event_ref = self.db.collection('events').document(event_id)
-        event_data = event_ref.get().to_dict()
+        event_data = (await self._run(event_ref.get)).to_dict()
         
         if not event_data:
             return None
@@ -171,30 +430,33 @@ class FirebaseService:
             # Use a current datetime instead of SERVER_TIMESTAMP for the nested structure
             attendee_data = {
                 'user_id': user_id,
-                'rsvp_date': datetime.now().isoformat()  # Use ISO format string instead of SERVER_TIMESTAMP
+                'rsvp_date': datetime.now(timezone.utc)  # Stored as a Timestamp so readers compare it without parsing
             }
-            attendees.append(attendee_data)
-            
-            # Update the event document with new attendee and count
-            attendees_count = len(attendees)
+            attendees_count = len(attendees) + 1
             
-            event_ref.update({
-                'attendees': attendees,
-                'attendees_count': attendees_count,
+            # ArrayUnion/Increment apply server-side, so concurrent RSVPs can't overwrite each other,
+            # and the event and user counters land in one atomic batch
+            batch = self.db.batch()
+            batch.update(event_ref, {
+                'attendees': firestore.ArrayUnion([attendee_data]),
+                # Plain id list so events can be queried by attendee (see get_events_attended_by)
+                'attendee_ids': firestore.ArrayUnion([user_id]),
+                'attendees_count': firestore.Increment(1),
                 'updated_at': firestore.SERVER_TIMESTAMP  # SERVER_TIMESTAMP can be used at the top level
             })
             
             # Increment the user's events_attended counter
-            user_ref = self.db.collection('users').document(user_id)
-            user_ref.update({
+            batch.update(self.db.collection('users').document(user_id), {
                 'events_attended': firestore.Increment(1),
                 'updated_at': firestore.SERVER_TIMESTAMP
             })
+            await self._run(batch.commit)
+            self.invalidate_user(user_id)
             
             print(f"Added user {user_id} to event {event_id}. New attendee count: {attendees_count}")
             print(f"Incremented events_attended counter for user {user_id}")
         
-        return event_ref.get().to_dict()
+        return (await self._run(event_ref.get)).to_dict()
 
     async def get_event_attendees(self, event_id: str, status: str = None) -> List[Dict[str, Any]]:
         """Get attendees for an event"""
@@ -202,7 +464,7 @@ class FirebaseService:
         # the status parameter is ignored
         
         event_ref = self.db.collection('events').document(event_id)
-        event = event_ref.get().to_dict()
+        event = (await self._run(event_ref.get)).to_dict()
         
         if not event:
             return []
@@ -217,32 +479,49 @@ class FirebaseService:
         feedback_ref = event_ref.collection('feedback').document(user_id)
         
         feedback_data['user_id'] = user_id
+        # Lets a collection_group('feedback') query select feedback by event (see get_feedback_for_events)
+        feedback_data['event_id'] = event_id
         feedback_data['created_at'] = firestore.SERVER_TIMESTAMP
         
-        feedback_ref.set(feedback_data)
-        return feedback_ref.get().to_dict()
+        await self._run(feedback_ref.set, feedback_data)
+        return (await self._run(feedback_ref.get)).to_dict()
     
     async def get_event_feedback(self, event_id: str) -> List[Dict[str, Any]]:
         """Get all feedback for an event"""
         event_ref = self.db.collection('events').document(event_id)
         feedback_ref = event_ref.collection('feedback')
         
-        feedback = []
-        for doc in feedback_ref.stream():
-            feedback.append(doc.to_dict())
-            
-        return feedback
+        return await self._run(self._stream_dicts, feedback_ref)
+
+    async def get_feedback_for_events(self, event_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get all feedback for several events with collection group queries instead of one read per event"""
+        feedback_group = self.db.collection_group('feedback')
+        # "in" takes at most 30 values, so larger id lists are queried in chunks
+        queries = [
+            feedback_group.where('event_id', 'in', event_ids[i:i + USERS_BULK_CHUNK_SIZE])
+            for i in range(0, len(event_ids), USERS_BULK_CHUNK_SIZE)
+        ]
+        results = await asyncio.gather(*(self._run(self._stream_dicts, query) for query in queries))
+        return [feedback for chunk_feedback in results for feedback in chunk_feedback]
+    
+    async def get_user_event_feedback(self, event_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+        """Get one user's feedback for an event (feedback documents are keyed by user ID)"""
+        feedback_ref = self.db.collection('events').document(event_id).collection('feedback').document(user_id)
+        feedback = await self._run(feedback_ref.get)
+        if feedback.exists:
+            return feedback.to_dict()
+        return None
 
     async def delete_event_feedback(self, event_id: str, user_id: str) -> bool:
         """Delete feedback for an event from a user"""
         event_ref = self.db.collection('events').document(event_id)
         feedback_ref = event_ref.collection('feedback').document(user_id)
         
-        feedback = feedback_ref.get()
+        feedback = await self._run(feedback_ref.get)
         if not feedback.exists:
             return False
         
-        feedback_ref.delete()
+        await self._run(feedback_ref.delete)
         return True
 
     async def recalculate_counts(self):
@@ -268,10 +547,17 @@ class FirebaseService:
             # Count accepted connections where user is either from_user_id or to_user_id
             from_count = len(list(connections_ref.where('from_user_id', '==', user_id).where('status', '==', 'accepted').stream()))
             to_count = len(list(connections_ref.where('to_user_id', '==', user_id).where('status', '==', 'accepted').stream()))
+            pending_count = len(list(connections_ref.where('to_user_id', '==', user_id).where('status', '==', 'pending').stream()))
             
             # Update user document
-            user_doc.reference.update({'connection_count': from_count + to_count})
+            user_doc.reference.update({
+                'connection_count': from_count + to_count,
+                'pending_incoming_count': pending_count
+            })
             print(f"Updated user {user_id} with {from_count + to_count} connections")
+        
+        # User documents were rewritten directly, so cached copies are stale
+        self._user_cache.clear()
 
     async def update_connections_arrays(self):
         """Update the connections array for all users based on accepted connections"""
@@ -279,34 +565,34 @@ class FirebaseService:
         connections_ref = self.db.collection('connections')
         accepted_connections = connections_ref.where('status', '==', 'accepted').stream()
         
-        # Keep track of which users we've updated
-        updated_users = set()
-        
+        # Collect each user's connected IDs from the accepted connections
+        connection_map = {}  # user_id -> {connected_user_ids}
         for conn in accepted_connections:
             conn_data = conn.to_dict()
             from_user_id = conn_data.get('from_user_id')
             to_user_id = conn_data.get('to_user_id')
             
             if from_user_id and to_user_id:
-                # Update from_user
-                from_user = await self.get_user(from_user_id)
-                if from_user:
-                    connections = from_user.get('connections', [])
-                    if to_user_id not in connections:
-                        connections.append(to_user_id)
-                        await self.update_user(from_user_id, {'connections': connections})
-                        updated_users.add(from_user_id)
-                
-                # Update to_user
-                to_user = await self.get_user(to_user_id)
-                if to_user:
-                    connections = to_user.get('connections', [])
-                    if from_user_id not in connections:
-                        connections.append(from_user_id)
-                        await self.update_user(to_user_id, {'connections': connections})
-                        updated_users.add(to_user_id)
-                        
-                print(f"Updated connection arrays for users {from_user_id} and {to_user_id}")
+                connection_map.setdefault(from_user_id, set()).add(to_user_id)
+                connection_map.setdefault(to_user_id, set()).add(from_user_id)
+        
+        # Keep track of which users we've updated
+        updated_users = set()
+        
+        # Only send the IDs each user is missing; ArrayUnion merges them server-side
+        users = await self.get_users_bulk(list(connection_map))
+        users_ref = self.db.collection('users')
+        for user_id, user_data in users.items():
+            missing = connection_map[user_id].difference(user_data.get('connections', []))
+            if missing:
+                users_ref.document(user_id).update({
+                    'connections': firestore.ArrayUnion(list(missing)),
+                    'updated_at': firestore.SERVER_TIMESTAMP
+                })
+                updated_users.add(user_id)
+                print(f"Added {len(missing)} connections to the array of user {user_id}")
+        
+        self.invalidate_user(*updated_users)
         
         # Return count of updated users
         return len(updated_users)
@@ -317,11 +603,19 @@ class FirebaseService:
         1. Convert event attendee subcollections to arrays
         2. Update user connection arrays
         3. Ensure consistent counts in both events and user documents
+        4. Re-key connection documents by their sorted user pair and add participants
+        5. Backfill attendee_ids, Timestamp rsvp_dates and feedback event_ids
+        6. Backfill each user's pending_incoming_count
         """
         result = {
             "events_updated": 0,
             "users_updated": 0,
-            "connections_processed": 0
+            "connections_processed": 0,
+            "connections_rekeyed": 0,
+            "attendee_ids_backfilled": 0,
+            "rsvp_dates_converted": 0,
+            "feedback_event_ids_backfilled": 0,
+            "pending_counts_backfilled": 0
         }
         
         # 1. Migrate event attendees from subcollections to arrays
@@ -355,6 +649,7 @@ class FirebaseService:
             if attendees_array:
                 event_doc.reference.update({
                     'attendees': attendees_array,
+                    'attendee_ids': [att['user_id'] for att in attendees_array],
                     'attendees_count': len(attendees_array)
                 })
                 print(f"Updated event {event_id} with {len(attendees_array)} attendees")
@@ -414,6 +709,75 @@ class FirebaseService:
                 print(f"Updated user {user_id} with {conn_count} connections")
                 result["users_updated"] += 1
         
+        # 4. Move connections stored under random IDs to their pair ID
+        conn_docs = list(connections_ref.stream())
+        # Pair IDs already taken, so duplicates are detected without a read per document
+        pair_ids = {conn_doc.id for conn_doc in conn_docs}
+        for conn_doc in conn_docs:
+            conn_data = conn_doc.to_dict()
+            from_user_id = conn_data.get('from_user_id')
+            to_user_id = conn_data.get('to_user_id')
+            if not from_user_id or not to_user_id:
+                continue
+            
+            pair_id = self._connection_pair_id(from_user_id, to_user_id)
+            participants = sorted((from_user_id, to_user_id))
+            if conn_doc.id == pair_id:
+                if conn_data.get('participants') != participants:
+                    conn_doc.reference.update({'participants': participants})
+                continue
+            
+            # Keep an existing pair document if the pair was already re-keyed
+            if pair_id not in pair_ids:
+                conn_data['id'] = pair_id
+                conn_data['participants'] = participants
+                connections_ref.document(pair_id).set(conn_data)
+                pair_ids.add(pair_id)
+            conn_doc.reference.delete()
+            print(f"Re-keyed connection {conn_doc.id} to {pair_id}")
+            result["connections_rekeyed"] += 1
+        
+        # 5. Backfill the queryable attendee_ids array, and Timestamp rsvp_dates, on events that predate them
+        for event_doc in events_ref.stream():
+            event_data = event_doc.to_dict()
+            attendees = event_data.get('attendees', [])
+            attendee_ids = [att.get('user_id') for att in attendees if att.get('user_id')]
+            if event_data.get('attendee_ids') != attendee_ids:
+                event_doc.reference.update({'attendee_ids': attendee_ids})
+                print(f"Backfilled attendee_ids on event {event_doc.id}")
+                result["attendee_ids_backfilled"] += 1
+            
+            string_dates = [att for att in attendees if isinstance(att.get('rsvp_date'), str)]
+            for att in string_dates:
+                # Same interpretation the feed uses for strings that haven't been migrated yet
+                rsvp_date = to_utc(att['rsvp_date'])
+                if rsvp_date is not None:
+                    att['rsvp_date'] = rsvp_date
+            if string_dates:
+                event_doc.reference.update({'attendees': attendees})
+                print(f"Converted {len(string_dates)} rsvp_date strings on event {event_doc.id}")
+                result["rsvp_dates_converted"] += len(string_dates)
+            
+            # Stamp this event's feedback with its event_id so collection group queries can find it
+            for feedback_doc in event_doc.reference.collection('feedback').stream():
+                if feedback_doc.to_dict().get('event_id') != event_doc.id:
+                    feedback_doc.reference.update({'event_id': event_doc.id})
+                    result["feedback_event_ids_backfilled"] += 1
+        
+        # 6. Backfill pending_incoming_count, which /pending-requests trusts once it is set
+        pending_counts = {}
+        for conn_doc in connections_ref.where('status', '==', 'pending').stream():
+            to_user_id = conn_doc.to_dict().get('to_user_id')
+            if to_user_id:
+                pending_counts[to_user_id] = pending_counts.get(to_user_id, 0) + 1
+        for user_doc in users_ref.stream():
+            pending_count = pending_counts.get(user_doc.id, 0)
+            if user_doc.to_dict().get('pending_incoming_count') != pending_count:
+                user_doc.reference.update({'pending_incoming_count': pending_count})
+                result["pending_counts_backfilled"] += 1
+        
+        self._user_cache.clear()
+        self._connections_cache.clear()
         return result
 
     async def recalculate_events_attended(self):
@@ -451,6 +815,7 @@ class FirebaseService:
                 print(f"Updated events_attended for user {user_id}: {events_attended}")
                 updated_count += 1
         
+        self._user_cache.clear()
         return updated_count
 
 firebase_service = FirebaseService()# Initialize service
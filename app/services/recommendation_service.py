@@ -5,21 +5,32 @@ from datetime import datetime, timedelta
 from math import radians, sin, cos, sqrt, atan2
 import time
 import random
-from firebase_admin import firestore
+import heapq
+from collections import OrderedDict
+
+from config import db as firebase_db
+
+# Most computed recommendation lists kept in memory; the oldest are evicted first
+RESULTS_CACHE_MAXSIZE = 10_000
 
 class RecommendationService:
     def __init__(self):
-        self.db = firestore.client()
+        self.db = firebase_db  # Shared client from config
         self.users_data = {}  
         self.events_data = {}  
         self.social_graph = None
         self.last_refresh_time = 0
         self.refresh_interval = 3600  # Refresh cache every hour
+        self._results_cache = OrderedDict()  # (kind, user_id, *args) -> (expires_at, recommendations), oldest first
+        self._results_keys = {}  # user_id -> keys of that user's entries in _results_cache
+        self.results_ttl = 60  # Seconds a computed recommendation list is reused
         
     async def initialize(self):
         """Initialize the recommendation engine"""
         await self._load_all_data()
         self._build_social_graph()
+        self._results_cache.clear()
+        self._results_keys.clear()
         self.last_refresh_time = time.time()
 
     async def refresh_if_needed(self):
@@ -371,12 +382,55 @@ class RecommendationService:
                 # print(f"Error processing event {event_id}: {str(e)}")
                 continue
                 
-        # Sort by score and limit results
-        recommended_events.sort(key=lambda x: x['score'], reverse=True)
-        return recommended_events[:limit]
-        
+        # Keep only the top results by score
+        return heapq.nlargest(limit, recommended_events, key=lambda x: x['score'])
+        
+    async def _cached_results(self, key: Tuple, compute) -> List[Dict[str, Any]]:
+        """Return recently computed recommendations for key, or compute and remember them"""
+        cached = self._results_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        results = await compute()
+        self._store_results(key, results)
+        return results
+    
+    def _store_results(self, key: Tuple, results: List[Dict[str, Any]]):
+        """Remember computed recommendations, evicting expired and then oldest entries"""
+        now = time.monotonic()
+        self._results_cache.pop(key, None)
+        self._results_cache[key] = (now + self.results_ttl, results)
+        self._results_keys.setdefault(key[1], set()).add(key)
+        
+        # Every entry shares one TTL, so insertion order is expiry order
+        while self._results_cache:
+            oldest, (expires_at, _) = next(iter(self._results_cache.items()))
+            if expires_at > now and len(self._results_cache) <= RESULTS_CACHE_MAXSIZE:
+                break
+            self._drop_results(oldest)
+    
+    def _drop_results(self, key: Tuple):
+        """Remove one cached entry and its per-user index reference"""
+        self._results_cache.pop(key, None)
+        keys = self._results_keys.get(key[1])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._results_keys[key[1]]
+    
+    def invalidate_user(self, *user_ids: str):
+        """Forget cached recommendations computed for the given users"""
+        for user_id in user_ids:
+            for key in self._results_keys.pop(user_id, ()):
+                self._results_cache.pop(key, None)
+    
     async def get_connection_recommendations(self, user_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Get connection recommendations for a user"""
+        return await self._cached_results(
+            ("connections", user_id, limit),
+            lambda: self._get_connection_recommendations(user_id, limit)
+        )
+    
+    async def _get_connection_recommendations(self, user_id: str, limit: int) -> List[Dict[str, Any]]:
         await self.refresh_if_needed()
         
         # Get user data
@@ -444,9 +498,8 @@ class RecommendationService:
                 'original_score': total_score
             })
             
-        # Sort by score and limit results
-        potential_connections.sort(key=lambda x: x['score'], reverse=True)
-        return potential_connections[:limit]
+        # Keep only the top results by score
+        return heapq.nlargest(limit, potential_connections, key=lambda x: x['score'])
         
     def _get_user_events(self, user_id: str) -> Set[str]:
         """Get set of events a user has attended"""
@@ -472,6 +525,12 @@ class RecommendationService:
         
     async def get_event_based_connection_recommendations(self, event_id: str, user_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Get connection recommendations for a user at a specific event"""
+        return await self._cached_results(
+            ("event", user_id, event_id, limit),
+            lambda: self._get_event_based_connection_recommendations(event_id, user_id, limit)
+        )
+    
+    async def _get_event_based_connection_recommendations(self, event_id: str, user_id: str, limit: int) -> List[Dict[str, Any]]:
         await self.refresh_if_needed()
         
         # Get event data
@@ -497,34 +556,35 @@ class RecommendationService:
             elif isinstance(attendee, str) and attendee != user_id and attendee not in user_connections:
                 attendees.append(attendee)
                 
+        # Everything that depends only on the user or the event is computed once
+        user_iset = frozenset(user_interests)
+        user_friends = None
+        if self.social_graph and user_id in self.social_graph:
+            user_friends = frozenset(self.social_graph.neighbors(user_id))
+        event_categories = frozenset(event.get('category', []))
+        event_title = event.get('title', '')
+        
         # Calculate recommendations based on event attendees
         recommendations = []
         for attendee_id in attendees:
             attendee = self.users_data.get(attendee_id)
             if not attendee:
                 continue
-                
-            attendee_interests = attendee.get('interests', [])
             
             # Calculate interest overlap
-            common_interests = set(user_interests).intersection(set(attendee_interests))
+            common_interests = user_iset.intersection(attendee.get('interests', ()))
             interest_score = len(common_interests) / max(len(user_interests), 1) if user_interests else 0
             
             # Find mutual connections
             mutual_connections = []
-            if self.social_graph and user_id in self.social_graph and attendee_id in self.social_graph:
-                user_friends = set(self.social_graph.neighbors(user_id))
-                attendee_friends = set(self.social_graph.neighbors(attendee_id))
-                mutual_connections = list(user_friends.intersection(attendee_friends))
+            if user_friends is not None and attendee_id in self.social_graph:
+                mutual_connections = user_friends.intersection(self.social_graph.neighbors(attendee_id))
                 
             mutual_score = min(1.0, len(mutual_connections) / 5)  # Cap at 5 mutual connections
             
             # Generate conversation starters related to the event
-            event_category = event.get('category', [])
-            event_title = event.get('title', '')
-            
             # Get common interests related to the event
-            event_related_interests = set(event_category).intersection(set(common_interests))
+            event_related_interests = event_categories.intersection(common_interests)
             
             conversation_starters = []
             if event_related_interests:
@@ -551,9 +611,8 @@ class RecommendationService:
                 'original_score': total_score
             })
             
-        # Sort by score and limit results
-        recommendations.sort(key=lambda x: x['score'], reverse=True)
-        return recommendations[:limit]
+        # Keep only the top results by score
+        return heapq.nlargest(limit, recommendations, key=lambda x: x['score'])
 
 # Initialize the recommendation service
 recommendation_service = RecommendationService()
\ No newline at end of file
@@ -0,0 +1,17 @@
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+def to_utc(value: Any) -> Optional[datetime]:
+    """
+    Normalize a Firestore Timestamp, naive datetime or legacy ISO string to an aware UTC datetime.
+    Naive values were written with datetime.now(), so they are read as server local time.
+    Returns None for missing or unparseable values.
+    """
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    return value.astimezone(timezone.utc)
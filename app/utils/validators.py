@@ -1,6 +1,10 @@
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
+# Allowed status values, built once rather than per call
+VALID_RSVP_STATUSES = frozenset(('attending', 'interested', 'declined'))
+VALID_CONNECTION_STATUSES = frozenset(('pending', 'accepted', 'declined', 'blocked'))
+
 def validate_event_dates(start_time: datetime, end_time: datetime) -> bool:
     """
     Validate that event end time is after start time
@@ -38,12 +42,10 @@ def validate_rsvp_status(status: str) -> bool:
     """
     Validate RSVP status
     """
-    valid_statuses = ['attending', 'interested', 'declined']
-    return status in valid_statuses
+    return status in VALID_RSVP_STATUSES
 
 def validate_connection_status(status: str) -> bool:
     """
     Validate connection status
     """
-    valid_statuses = ['pending', 'accepted', 'declined', 'blocked']
-    return status in valid_statuses
\ No newline at end of file
+    return status in VALID_CONNECTION_STATUSES
\ No newline at end of file
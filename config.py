@@ -19,6 +19,13 @@ class Settings(BaseSettings):
     API_DEBUG: bool = os.getenv("API_DEBUG", "False").lower() in ("true", "1", "t")
     API_HOST: str = os.getenv("API_HOST", "0.0.0.0")
     API_PORT: int = int(os.getenv("API_PORT", "8000"))
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")  # e.g. DEBUG, or CRITICAL to silence app logs
+    
+    # Firestore settings (threads that run blocking client calls; they share one gRPC channel)
+    FIRESTORE_MAX_WORKERS: int = int(os.getenv("FIRESTORE_MAX_WORKERS", "40"))
+    
+    # Cache settings (responses are cached in-process only when REDIS_URL is empty)
+    REDIS_URL: str = os.getenv("REDIS_URL", "")
     
     # Event settings
     DEFAULT_EVENT_RADIUS_KM: float = 10.0
@@ -40,6 +47,6 @@ firebase_admin.initialize_app(cred, {
     'databaseURL': settings.FIREBASE_DATABASE_URL
 })
 
-# Create and export database client
+# Create and export the database client, the single Firestore handle the services share
 db = firestore.client()
 __all__ = ['db', 'settings']
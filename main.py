@@ -1,14 +1,33 @@
+import logging
+import logging.handlers
+import queue
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api import users, events, connections, feedback, admin
 from app.api.feedback import router as feedback_router
 from app.api.dashboard import router as dashboard_router
+from config import settings
+
+# Request handlers only enqueue log records; a listener thread formats and writes them
+log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+logging.basicConfig(level=settings.LOG_LEVEL.upper(), handlers=[logging.handlers.QueueHandler(log_queue)])
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    log_listener.start()
+    yield
+    log_listener.stop()
 
 app = FastAPI(
+    lifespan=lifespan,
     title="EventMesh API",
     description="Backend API for EventMesh mobile application",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS